@@ -593,11 +593,11 @@ class BaseConverter(ABC):
             )
             # Apply speaker role assignment
             new_md = extract_and_assign_speakers(content_dict, new_md, str(json_path))
-            # Update index helper and add titles BEFORE grouping
+            # Update index helper, then add titles and group sentences in one pass
             self.update_index_helper(content_dict,new_md)
-            add_titles_to_json(index_helper=self.index_helper, json_file_path=json_path)
-            # Group sentences in transcript to reduce list length (after adding titles)
-            group_sentences_in_transcript(str(json_path), max_time_gap=5.0, max_words=200)
+            process_transcript(
+                str(json_path), index_helper=self.index_helper, max_time_gap=5.0, max_words=200
+            )
         elif file_type == "ipynb":
             content_dict = get_strutured_content_for_ipynb(
                 md_content=content_text,
@@ -2,10 +2,19 @@ import re
 from pathlib import Path
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from markdownify import MarkdownConverter
 
 from file_conversion_router.conversion.base_converter import BaseConverter
 
+# A code fence that does not start its line gets a newline inserted before it
+CODE_FENCE_RE = re.compile(r"(?<!^)(```)", flags=re.MULTILINE)
+REPEATED_SPACES_RE = re.compile(r"[ \t]{2,}")
+COMPOSING_PROGRAMS_MOJIBAKE_RE = re.compile(r'câ¬mpâ¬sing prâ¬grams')
+
+# Converts the already-parsed soup directly, instead of markdownify(str(tag))
+# serializing it back to HTML and parsing it a second time
+markdown_converter = MarkdownConverter(heading_style="ATX", default_title=True)
+
 content_tags_dict = {
     "https://docs.opencv.org/4.x/d6/d00/tutorial_py_root.html": [
         ("div", {"class": "contents"})
@@ -79,7 +88,7 @@ class HtmlConverter(BaseConverter):
         url = metadata_content.get("URL")
 
         # Parse the HTML content
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml")
         content_tags = get_content_tags(url, content_tags_dict)
         markdown_outputs = []
         if content_tags:
@@ -88,24 +97,22 @@ class HtmlConverter(BaseConverter):
                 content = soup.find_all(tag_type, tag_attr)
                 for item in content:
                     # Convert each HTML item to Markdown
-                    markdown = md(str(item), heading_style="ATX", default_title=True)
-                    modified_content = re.sub(
-                        r"(?<!^)(```)", r"\n\1", markdown, flags=re.MULTILINE
+                    # Strip the block separators markdownify only strips at document level
+                    markdown_outputs.append(
+                        markdown_converter.convert_soup(item).strip("\n")
                     )
-                    markdown_outputs.append(modified_content)
-            # Concatenate all markdown outputs with a newline
-            final_markdown = "\n\n".join(markdown_outputs)
+            # Concatenate all markdown outputs with a newline. Each block starts
+            # a new line, so fixing fences once on the result is the same as per block
+            final_markdown = CODE_FENCE_RE.sub(r"\n\1", "\n\n".join(markdown_outputs))
         else:
-            final_markdown = md(str(soup), heading_style="ATX", default_title=True)
-            final_markdown = re.sub(
-                r"(?<!^)(```)", r"\n\1", final_markdown, flags=re.MULTILINE
-            )
-            final_markdown = re.sub(r'Â(?=\xa0)', '', final_markdown)
-            final_markdown = final_markdown.replace('\xa0', ' ')
+            final_markdown = markdown_converter.convert_soup(soup)
+            final_markdown = CODE_FENCE_RE.sub(r"\n\1", final_markdown)
+            # Mojibake "Â" before a non-breaking space goes away with it
+            final_markdown = final_markdown.replace('Â\xa0', ' ').replace('\xa0', ' ')
             final_markdown = final_markdown.replace('\\_', "_")
             final_markdown = final_markdown.replace('â', '-')  # General dash replacement
-            final_markdown = re.sub(r'[ \t]{2,}', ' ', final_markdown)
-            final_markdown = re.sub(r'câ¬mpâ¬sing prâ¬grams', 'composing programs', final_markdown)
+            final_markdown = REPEATED_SPACES_RE.sub(' ', final_markdown)
+            final_markdown = COMPOSING_PROGRAMS_MOJIBAKE_RE.sub('composing programs', final_markdown)
         with open(output_path, "w") as output_file:
 
             output_file.write(final_markdown)
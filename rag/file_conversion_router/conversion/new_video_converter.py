@@ -13,11 +13,18 @@ import re
 from pathlib import Path
 import torch
 from typing import List, Dict, Tuple
+from functools import lru_cache
 import warnings
 
 warnings.filterwarnings("ignore", category=UserWarning, module="torchaudio._backend.utils")
 
 
+@lru_cache(maxsize=4)
+def _load_whisper_model(name: str, device: str):
+    """Load a Whisper model once per (name, device) and reuse it across videos."""
+    return whisper.load_model(name, device=device)
+
+
 class NewVideoConverter(BaseConverter):
     """
     Video converter using Whisper Large V3 for transcription and
@@ -55,7 +62,7 @@ class NewVideoConverter(BaseConverter):
 
         # Step 1: Load Whisper large-v3 model
         print("Loading Whisper large-v3 model...")
-        whisper_model = whisper.load_model("large-v3", device=device)
+        whisper_model = _load_whisper_model("large-v3", device)
 
         # Step 2: Transcribe audio with word-level timestamps
         print("Transcribing audio...")
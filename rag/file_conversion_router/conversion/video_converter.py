@@ -14,10 +14,46 @@ from scenedetect import FrameTimecode
 from dotenv import load_dotenv
 import os
 from openai import OpenAI
+import gc
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from textwrap import dedent
 
+
+@lru_cache(maxsize=4)
+def _load_align_model(language_code: str, device: str):
+    """Load the whisperx alignment model once per (language, device) and reuse it."""
+    return whisperx.load_align_model(language_code=language_code, device=device)
+
+
+@lru_cache(maxsize=4)
+def _load_whisperx_model(name: str, device: str, compute_type: str, language: str):
+    """Load the whisperx transcription model once and reuse it across videos."""
+    return whisperx.load_model(name, device=device, compute_type=compute_type, language=language)
+
+
+@lru_cache(maxsize=2)
+def _load_diarize_model(device: str):
+    """Load the whisperx diarization pipeline once per device and reuse it."""
+    from whisperx.diarize import DiarizationPipeline
+    return DiarizationPipeline(device=device)
+
+
+def release_whisperx_models() -> None:
+    """Drop the cached WhisperX models and hand their GPU memory back to the driver."""
+    loaders = (_load_whisperx_model, _load_align_model, _load_diarize_model)
+    if not any(loader.cache_info().currsize for loader in loaders):
+        return
+    for loader in loaders:
+        loader.cache_clear()
+    gc.collect()
+    import torch
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
 class VideoConverter(BaseConverter):
     def __init__(self, course_name, course_code, file_uuid: str = None):
         super().__init__(course_code=course_code,course_name=course_name, file_uuid=file_uuid)
@@ -38,26 +74,26 @@ class VideoConverter(BaseConverter):
         device = "cuda"
         batch_size = 16
         compute_type = "float16"
-        model = whisperx.load_model('large-v3', device='cuda', compute_type=compute_type, language="en")
-        audio = whisperx.load_audio(audio_file_path)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Decode audio with ffmpeg on the CPU while the transcription model loads
+            audio_future = pool.submit(whisperx.load_audio, audio_file_path)
+            model = _load_whisperx_model('large-v3', device, compute_type, "en")
+            audio = audio_future.result()
+        # The GPU stages run one at a time to keep peak VRAM at a single model's working set
         result = model.transcribe(audio, batch_size=batch_size)
-        model_a, metadata = whisperx.load_align_model(language_code="en", device=device)
+        model_a, metadata = _load_align_model("en", device)
         result = whisperx.align(result["segments"], model_a, metadata, audio, device, return_char_alignments=False)
-        from whisperx.diarize import DiarizationPipeline
-        diarize_model = DiarizationPipeline(device=device)
-        diarize_segments = diarize_model(audio)
+        diarize_segments = _load_diarize_model(device)(audio)
         result = whisperx.assign_word_speakers(diarize_segments, result)
-        segments = []
-        if "segments" in result:
-            for segment in result["segments"]:
-                segment_dict = {
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "text": segment["text"],
-                    "speaker": segment["speaker"] if "speaker" in segment else "UNKNOWN"
-                }
-                segments.append(segment_dict)
-        return segments
+        return [
+            {
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": segment["text"],
+                "speaker": segment.get("speaker", "UNKNOWN"),
+            }
+            for segment in result.get("segments", ())
+        ]
 
     def paragraph_generator(self, transcript, seg_time):
         """
@@ -23,6 +23,11 @@ import sqlite3
 import tempfile
 import uuid
 import zipfile
+
+# Use CUDA's stream-ordered allocator (cudaMallocAsync) for MinerU and WhisperX.
+# Must be set before torch is imported by the converters below.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "backend:cudaMallocAsync")
+
 from file_conversion_router.utils.artifact_helpers import (
     json_attachment as _json_attachment_fn,
     binary_attachment as _binary_attachment_fn,
@@ -37,7 +42,7 @@ from starlette.background import BackgroundTask
 from file_conversion_router.conversion.pdf_converter import PdfConverter
 from file_conversion_router.conversion.md_converter import MarkdownConverter
 from file_conversion_router.conversion.html_converter import HtmlConverter
-from file_conversion_router.conversion.video_converter import VideoConverter
+from file_conversion_router.conversion.video_converter import VideoConverter, release_whisperx_models
 from file_conversion_router.conversion.notebook_converter import NotebookConverter
 from file_conversion_router.conversion.python_converter import PythonConverter
 from file_conversion_router.conversion.rst_converter import RstConverter
@@ -74,7 +79,12 @@ PDF_EXTENSIONS = {".pdf"}
 # Only one GPU-heavy job at a time (single 4090, ~24 GB VRAM)
 _gpu_lock = asyncio.Semaphore(1)
 
+# Scratch space for uploads and converter output. Point this at a tmpfs
+# (e.g. /dev/shm/tai_conversion) to keep per-request files off the disk.
+TMP_ROOT = Path(os.environ["CONVERSION_TMP_DIR"]) if os.environ.get("CONVERSION_TMP_DIR") else None
+
 MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024  # 50 MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
 
 # ---------------------------------------------------------------------------
 # Database — test DB path (override with CONVERSION_DB env var)
@@ -151,21 +161,32 @@ async def _init_db():
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _file_hash(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()[:16]
-
-
 def _deterministic_uuid(file_hash: str, file_name: str) -> str:
     return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{file_hash}:{file_name}"))
 
 
-def _save_upload(upload: UploadFile, dest_dir: Path) -> tuple[Path, bytes]:
-    """Save an uploaded file to *dest_dir* and return (saved_path, raw_bytes)."""
+def _make_tmp_dir(prefix: str) -> Path:
+    """Create a per-request scratch directory under TMP_ROOT (or the system temp dir)."""
+    if TMP_ROOT is not None:
+        TMP_ROOT.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=TMP_ROOT))
+
+
+def _save_upload(upload: UploadFile, dest_dir: Path) -> tuple[Path, str]:
+    """Stream an uploaded file to *dest_dir* and return (saved_path, file_hash).
+
+    The upload is copied in chunks and hashed on the way, so large PDFs and
+    videos are never held in memory as a whole.
+    """
     dest_dir.mkdir(parents=True, exist_ok=True)
-    content = upload.file.read()
     file_path = dest_dir / upload.filename
-    file_path.write_bytes(content)
-    return file_path, content
+    digest = hashlib.sha256()
+    upload.file.seek(0)
+    with open(file_path, "wb") as f:
+        while chunk := upload.file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            f.write(chunk)
+    return file_path, digest.hexdigest()[:16]
 
 
 def _json_attachment(path: Path) -> dict | None:
@@ -256,6 +277,9 @@ def _run_to_markdown(
 ):
     """Pick the right converter by extension and return (md_path, converter)."""
     suffix = input_path.suffix.lower()
+    if suffix in PDF_EXTENSIONS:
+        # MinerU needs the VRAM held by WhisperX models cached for earlier videos
+        release_whisperx_models()
     cls = _get_converter(suffix)
     converter = cls("", "", file_uuid)
     if local_only and hasattr(converter, "use_remote_vlm_descriptions"):
@@ -285,9 +309,9 @@ async def convert_file(
     suffix = Path(file.filename).suffix.lower()
     _get_converter(suffix)  # validates extension
 
-    tmp_dir = Path(tempfile.mkdtemp(prefix="tai_convert_"))
+    tmp_dir = _make_tmp_dir("tai_convert_")
     try:
-        input_path, raw = _save_upload(file, tmp_dir / "input")
+        input_path, _ = await asyncio.to_thread(_save_upload, file, tmp_dir / "input")
         output_dir = tmp_dir / "output"
 
         if suffix in GPU_EXTENSIONS:
@@ -296,8 +320,8 @@ async def convert_file(
                     _run_to_markdown, input_path, output_dir
                 )
         else:
-            md_path, converter = _run_to_markdown(
-                input_path, output_dir, local_only=True
+            md_path, converter = await asyncio.to_thread(
+                _run_to_markdown, input_path, output_dir, local_only=True
             )
 
         if md_path is None or not Path(md_path).exists():
@@ -338,9 +362,9 @@ async def convert_file_archive(
     suffix = Path(file.filename).suffix.lower()
     _get_converter(suffix)
 
-    tmp_dir = Path(tempfile.mkdtemp(prefix="tai_convert_archive_"))
+    tmp_dir = _make_tmp_dir("tai_convert_archive_")
     try:
-        input_path, _ = _save_upload(file, tmp_dir / "input")
+        input_path, _ = await asyncio.to_thread(_save_upload, file, tmp_dir / "input")
         output_dir = tmp_dir / "output"
 
         if suffix in GPU_EXTENSIONS:
@@ -349,8 +373,8 @@ async def convert_file_archive(
                     _run_to_markdown, input_path, output_dir
                 )
         else:
-            md_path, converter = _run_to_markdown(
-                input_path, output_dir, local_only=True
+            md_path, converter = await asyncio.to_thread(
+                _run_to_markdown, input_path, output_dir, local_only=True
             )
 
         if md_path is None or not Path(md_path).exists():
@@ -395,10 +419,9 @@ async def process_file(
     suffix = Path(file.filename).suffix.lower()
     _get_converter(suffix)  # validates extension
 
-    tmp_dir = Path(tempfile.mkdtemp(prefix="tai_process_"))
+    tmp_dir = _make_tmp_dir("tai_process_")
     try:
-        input_path, raw = _save_upload(file, tmp_dir / "input")
-        fhash = _file_hash(raw)
+        input_path, fhash = await asyncio.to_thread(_save_upload, file, tmp_dir / "input")
         file_uuid = _deterministic_uuid(fhash, file.filename)
         output_dir = tmp_dir / "output"
 
@@ -409,8 +432,8 @@ async def process_file(
                     _run_to_markdown, input_path, output_dir, file_uuid
                 )
         else:
-            md_path, converter = _run_to_markdown(
-                input_path, output_dir, file_uuid
+            md_path, converter = await asyncio.to_thread(
+                _run_to_markdown, input_path, output_dir, file_uuid
             )
 
         if md_path is None or not Path(md_path).exists():
@@ -13,6 +13,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any
 
+import orjson
 from fastapi import UploadFile
 
 from file_conversion_router.config import (
@@ -141,6 +142,8 @@ class BatchJobManager:
 
     def __init__(self):
         self._jobs: Dict[str, BatchJobStatus] = {}
+        # Serialized JSON per job, dropped whenever the job is mutated
+        self._json_cache: Dict[str, bytes] = {}
         self._progress_queues: Dict[str, asyncio.Queue] = {}
         self._cancel_events: Dict[str, asyncio.Event] = {}
 
@@ -201,6 +204,8 @@ class BatchJobManager:
         if not job:
             return None
 
+        self._json_cache.pop(job_id, None)
+
         if status:
             job.status = status
         if current_file is not None:
@@ -274,6 +279,23 @@ class BatchJobManager:
         )
         return jobs[:limit]
 
+    def get_job_json(self, job_id: str) -> Optional[bytes]:
+        """Get the serialized JSON for a job, reusing it until the job changes."""
+        cached = self._json_cache.get(job_id)
+        if cached is None:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            cached = orjson.dumps(job.model_dump(mode="json"))
+            self._json_cache[job_id] = cached
+        return cached
+
+    def list_jobs_json(self, limit: int = 100) -> bytes:
+        """List recent jobs as a serialized JSON array."""
+        return b"[" + b",".join(
+            self.get_job_json(job.job_id) for job in self.list_jobs(limit=limit)
+        ) + b"]"
+
 
 class BatchProcessor:
     """Processes batch file conversions."""
@@ -305,7 +327,7 @@ class BatchProcessor:
         self.job_manager.update_job_status(job_id, status=JobStatus.PROCESSING)
 
         # Push job start event
-        await self.job_manager.push_progress(job_id, ProgressEvent(
+        await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
             event_type=ProgressEventType.JOB_START,
             job_id=job_id,
             total_files=len(file_paths),
@@ -346,7 +368,7 @@ class BatchProcessor:
 
             if status == "started":
                 self.job_manager.update_job_status(job_id, current_file=file_name)
-                await self.job_manager.push_progress(job_id, ProgressEvent(
+                await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
                     event_type=ProgressEventType.FILE_START,
                     job_id=job_id,
                     file_name=file_name,
@@ -371,7 +393,7 @@ class BatchProcessor:
                         scenes_url=scenes_url,
                     ),
                 )
-                await self.job_manager.push_progress(job_id, ProgressEvent(
+                await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
                     event_type=ProgressEventType.FILE_DONE,
                     job_id=job_id,
                     file_name=file_name,
@@ -390,7 +412,7 @@ class BatchProcessor:
                         error=error,
                     ),
                 )
-                await self.job_manager.push_progress(job_id, ProgressEvent(
+                await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
                     event_type=ProgressEventType.FILE_ERROR,
                     job_id=job_id,
                     file_name=file_name,
@@ -417,7 +439,7 @@ class BatchProcessor:
                         scenes_url=scenes_url,
                     ),
                 )
-                await self.job_manager.push_progress(job_id, ProgressEvent(
+                await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
                     event_type=ProgressEventType.FILE_DONE,
                     job_id=job_id,
                     file_name=file_name,
@@ -476,7 +498,7 @@ class BatchProcessor:
             self.job_manager.update_job_status(job_id, status=JobStatus.COMPLETED)
 
             # Push completion event
-            await self.job_manager.push_progress(job_id, ProgressEvent(
+            await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
                 event_type=ProgressEventType.JOB_COMPLETE,
                 job_id=job_id,
                 total_files=len(file_paths),
@@ -504,7 +526,7 @@ class BatchProcessor:
                 duration_seconds=duration,
             )
 
-            await self.job_manager.push_progress(job_id, ProgressEvent(
+            await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
                 event_type=ProgressEventType.JOB_COMPLETE,
                 job_id=job_id,
                 result=conversion_result,
@@ -530,7 +552,7 @@ class BatchProcessor:
                 duration_seconds=duration,
             )
 
-            await self.job_manager.push_progress(job_id, ProgressEvent(
+            await self.job_manager.push_progress(job_id, ProgressEvent.model_construct(
                 event_type=ProgressEventType.JOB_COMPLETE,
                 job_id=job_id,
                 result=conversion_result,
@@ -20,7 +20,7 @@ from file_conversion_router.conversion.notebook_converter import NotebookConvert
 from file_conversion_router.conversion.pdf_converter import PdfConverter
 from file_conversion_router.conversion.python_converter import PythonConverter
 from file_conversion_router.conversion.rst_converter import RstConverter
-from file_conversion_router.conversion.video_converter import VideoConverter
+from file_conversion_router.conversion.video_converter import VideoConverter, release_whisperx_models
 from file_conversion_router.utils.logger import content_logger, set_log_file_path
 from file_conversion_router.classes.chunk import Chunk
 import hashlib
@@ -131,6 +131,10 @@ def process_single_file(
     if not file_uuid:
         file_uuid = deterministic_file_uuid(fhash)
 
+    if converter_class is PdfConverter:
+        # MinerU needs the VRAM held by WhisperX models cached for earlier videos
+        release_whisperx_models()
+
     # Create converter instance
     converter = converter_class(course_name, course_code, file_uuid)
 
@@ -308,6 +312,9 @@ def process_folder(
             continue
 
         file_uuid = deterministic_file_uuid(fhash)
+        if converter_class is PdfConverter:
+            # MinerU needs the VRAM held by WhisperX models cached for earlier videos
+            release_whisperx_models()
         converter = converter_class(course_name, course_code, file_uuid)
 
         try:
@@ -442,6 +449,8 @@ def process_folder(
 
     # Generate embeddings if requested
     if generate_embeddings:
+        # The embedding model needs the VRAM held by cached WhisperX models
+        release_whisperx_models()
         logging.info(f"Generating embeddings for course: {course_code}")
         try:
             # Import here to avoid circular imports
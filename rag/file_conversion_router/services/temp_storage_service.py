@@ -5,10 +5,12 @@ including directory creation, file saving, and cleanup operations.
 """
 
 import asyncio
+import io
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 from datetime import datetime, timedelta
 
 from fastapi import UploadFile
@@ -21,6 +23,37 @@ from file_conversion_router.config import (
 logger = logging.getLogger(__name__)
 
 
+def _copy_upload(source: BinaryIO, file_path: Path) -> int:
+    """
+    Copy an upload's backing file to file_path and return the bytes written.
+
+    Sources backed by a real file descriptor are copied in the kernel with
+    os.sendfile; anything else is copied with shutil.copyfileobj. Asking a
+    SpooledTemporaryFile for its descriptor rolls it to disk first, which
+    costs at most its spool size.
+    """
+    source.seek(0)
+    with open(file_path, "wb") as destination:
+        if hasattr(os, "sendfile"):
+            try:
+                src_fd = source.fileno()
+            except (io.UnsupportedOperation, OSError):
+                src_fd = None
+            if src_fd is not None:
+                try:
+                    offset = 0
+                    while sent := os.sendfile(destination.fileno(), src_fd, offset, 1 << 30):
+                        offset += sent
+                    return offset
+                except OSError:
+                    # e.g. a filesystem without sendfile support; restart with a plain copy
+                    source.seek(0)
+                    destination.seek(0)
+                    destination.truncate()
+        shutil.copyfileobj(source, destination)
+        return destination.tell()
+
+
 class TempStorageService:
     """Service for managing temporary file storage during batch uploads."""
 
@@ -71,11 +104,10 @@ class TempStorageService:
         else:
             file_path = job_dir / file.filename
 
-        # Write file content
-        content = await file.read()
-        file_path.write_bytes(content)
+        # Write file content off the event loop, without buffering it in memory
+        size = await asyncio.to_thread(_copy_upload, file.file, file_path)
 
-        logger.debug(f"Saved file: {file_path} ({len(content)} bytes)")
+        logger.debug(f"Saved file: {file_path} ({size} bytes)")
         return file_path
 
     async def save_uploaded_files(
@@ -96,17 +128,27 @@ class TempStorageService:
             List of paths to saved files
         """
         self.create_job_directory(job_id)
-        saved_paths = []
 
-        for file in files:
-            # Extract relative path from filename if present and preserve_paths is True
-            if preserve_paths and "/" in file.filename:
-                relative_path = file.filename
-            else:
-                relative_path = None
-
-            path = await self.save_uploaded_file(job_id, file, relative_path)
-            saved_paths.append(path)
+        # Extract relative path from filename if present and preserve_paths is True
+        relative_paths = [
+            file.filename if preserve_paths and "/" in file.filename else None
+            for file in files
+        ]
+
+        # Every upload lands at a path derived from its filename
+        file_names = [file.filename for file in files]
+        if len(set(file_names)) == len(file_names):
+            # Each copy runs in a worker thread, so distinct files save concurrently
+            saved_paths = list(await asyncio.gather(*(
+                self.save_uploaded_file(job_id, file, relative_path)
+                for file, relative_path in zip(files, relative_paths)
+            )))
+        else:
+            # Repeated names overwrite one another, so keep their upload order
+            saved_paths = [
+                await self.save_uploaded_file(job_id, file, relative_path)
+                for file, relative_path in zip(files, relative_paths)
+            ]
 
         logger.info(f"Saved {len(saved_paths)} files for job {job_id}")
         return saved_paths
@@ -5,20 +5,43 @@ This module provides functionality to process markdown content from educational
 extract key concepts, generate assessment questions, and manage speaker roles in transcripts.
 """
 
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from pathlib import Path
 from textwrap import dedent
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 import os
 import re
+import sys
 import json
+import mmap
+import fastjsonschema
+import numpy as np
+import orjson
 import yaml
 
 from dotenv import load_dotenv
 from openai import OpenAI
 from loguru import logger
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; _group_boundaries also runs as plain Python
+    njit = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large transcripts are then loaded in one go
+    ijson = None
+
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml; use the pure-Python safe classes
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 
 # ========================
 # Configuration & Constants
@@ -27,6 +50,197 @@ from loguru import logger
 # Standard .env file location for RAG component
 RAG_ENV_PATH = Path(__file__).parent.parent.parent / ".env"
 
+# Transcripts at least this large are stream-parsed instead of loaded whole
+STREAM_PARSE_THRESHOLD_BYTES = 2 * 1024 * 1024
+# JSON files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+# Markdown heading patterns
+_TITLE_RE = re.compile(r"^#+(.*)$", re.MULTILINE)
+_HEADING_LEVEL_RE = re.compile(r"^[^\S\n]*(#+)", re.MULTILINE)
+_MD_TITLE_RE = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<title>\S.*?)$")
+_PARA_SPLIT = re.compile(r"\n\s*\n")
+_FILENAME_NORMALIZE = str.maketrans({"-": " ", "_": " "})
+
+
+def _load_json_file(json_file_path: str) -> Any:
+    """Load a JSON file with orjson, memory-mapping large files to avoid a copy."""
+    with open(json_file_path, "rb") as json_file:
+        if os.fstat(json_file.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+            return orjson.loads(json_file.read())
+        with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+@contextmanager
+def _atomic_open(path: Union[str, Path], mode: str = "wb"):
+    """Write to a temporary file beside path and move it into place on success."""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, mode) as tmp_file:
+            yield tmp_file
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def _dump_json_file(json_file_path: str, data: Any, pretty: bool = True, indent: int = 2) -> None:
+    """
+    Write data to a JSON file, indented by indent spaces unless pretty is False.
+
+    orjson only indents by two spaces, so other widths fall back to json.
+    """
+    if pretty and indent != 2:
+        payload = json.dumps(data, indent=indent).encode()
+    else:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    with _atomic_open(json_file_path) as json_file:
+        json_file.write(payload)
+
+
+def _iter_json_array(json_file_path: str) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, streaming large files with ijson."""
+    if ijson is not None and os.path.getsize(json_file_path) >= STREAM_PARSE_THRESHOLD_BYTES:
+        with open(json_file_path, "rb") as json_file:
+            yield from ijson.items(json_file, "item", use_float=True)
+    else:
+        yield from _load_json_file(json_file_path)
+
+
+def _dump_json_array(json_file_path: str, items: Iterable[Any], pretty: bool = True) -> int:
+    """
+    Write items to a JSON array file one at a time.
+
+    The output matches _dump_json_file on the equivalent list. Returns the
+    number of items written.
+    """
+    if pretty:
+        opening, separator, closing = b"[\n  ", b",\n  ", b"\n]"
+    else:
+        opening, separator, closing = b"[", b",", b"]"
+
+    count = 0
+    with _atomic_open(json_file_path) as json_file:
+        for item in items:
+            json_file.write(separator if count else opening)
+            if pretty:
+                json_file.write(orjson.dumps(item, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+            else:
+                json_file.write(orjson.dumps(item))
+            count += 1
+        json_file.write(closing if count else b"[]")
+    return count
+
+
+def _shift_title_levels(levels: List[int]) -> List[int]:
+    """Shift title levels in place so no title skips a hierarchy level."""
+    last_level = 0
+    n = len(levels)
+    for i in range(n):
+        current_level = levels[i]
+        if current_level > last_level + 1:
+            diff = current_level - (last_level + 1)
+            # Shift the contiguous run of titles at or below this depth
+            end = i
+            while end < n and levels[end] >= current_level:
+                end += 1
+            levels[i:end] = [level - diff for level in levels[i:end]]
+        last_level = levels[i]
+    return levels
+
+
+def _group_boundaries(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    speaker_ids: np.ndarray,
+    is_title: np.ndarray,
+    word_counts: np.ndarray,
+    max_gap: float,
+    max_words: int
+) -> np.ndarray:
+    """
+    Return the index at which each transcript group starts.
+
+    An entry opens a new group if it or the current group is a title, the speaker
+    changes, the gap since the previous entry exceeds max_gap, or the group would
+    exceed max_words.
+    """
+    n = starts.shape[0]
+    boundaries = np.empty(n, dtype=np.int64)
+    boundaries[0] = 0
+    count = 1
+    group_start = 0
+    group_words = word_counts[0]
+    for k in range(1, n):
+        if (is_title[k] or is_title[group_start]
+                or speaker_ids[k] != speaker_ids[group_start]
+                or starts[k] - ends[k - 1] > max_gap
+                or group_words + word_counts[k] > max_words):
+            boundaries[count] = k
+            count += 1
+            group_start = k
+            group_words = word_counts[k]
+        else:
+            group_words += word_counts[k]
+    return boundaries[:count]
+
+
+if njit is not None:
+    _group_boundaries = njit(cache=True)(_group_boundaries)
+
+
+def _start_time_keys(transcript_list: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Return the running maximum of the transcript start times.
+
+    A missing, null or non-numeric start time carries the previous key forward,
+    so such entries never decide where a title goes. A NaN start time acts as
+    infinity, matching a linear scan that stops at the first entry whose start
+    is not below the title time.
+    """
+    keys = np.empty(len(transcript_list), dtype=np.float64)
+    latest = -np.inf
+    for i, entry in enumerate(transcript_list):
+        try:
+            start = float(entry.get("start time"))
+        except (TypeError, ValueError):
+            start = latest
+        if start != start:
+            start = np.inf
+        if start > latest:
+            latest = start
+        keys[i] = latest
+    return keys
+
+
+@lru_cache(maxsize=64)
+def _compile_schema(schema_json: bytes) -> Callable[[Any], Any]:
+    """Generate a validator function once per canonical (key-sorted) schema JSON."""
+    return fastjsonschema.compile(orjson.loads(schema_json))
+
+
+def _check_response(content_dict: Any, response_format: Dict[str, Any]) -> None:
+    """Log a warning if a structured response does not match the schema it was requested with."""
+    schema = response_format.get("json_schema", {}).get("schema")
+    if schema is None:
+        return
+    try:
+        _compile_schema(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))(content_dict)
+    except fastjsonschema.JsonSchemaValueException as e:
+        logger.warning(f"OpenAI response does not match its schema: {e.message}")
+    except fastjsonschema.JsonSchemaDefinitionException as e:
+        logger.warning(f"Skipping response validation, unsupported schema: {str(e)}")
+
+
+@lru_cache(maxsize=32)
+def _speaker_id_pattern(speaker_ids: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile one alternation matching any of the speaker tags, e.g. "Speaker_00:"."""
+    alternation = "|".join(re.escape(sid) for sid in sorted(speaker_ids, key=len, reverse=True))
+    return re.compile(rf"\b({alternation}):")
+
 
 def get_openai_api_key() -> Optional[str]:
     """
@@ -68,6 +282,8 @@ class ProcessingConfig:
     max_words_per_group: int = 200
     min_paragraphs_for_sections: int = 5
     max_sections: int = 5
+    # Transcript JSON is machine-read; set True to indent it for inspection
+    pretty_json: bool = False
 
 
 @dataclass
@@ -158,7 +374,9 @@ class OpenAIClientWrapper:
             )
 
             content = response.choices[0].message.content
-            return json.loads(content)
+            content_dict = json.loads(content)
+            _check_response(content_dict, response_format)
+            return content_dict
 
         except Exception as e:
             logger.error(f"OpenAI API error: {str(e)}")
@@ -564,6 +782,13 @@ class SchemaFactory:
 # Content Processor
 # ========================
 
+@dataclass
+class MarkdownAnalysis:
+    """Markdown content with its redundant title removed, plus its paragraph count."""
+    content: str
+    paragraph_count: int
+
+
 class ContentProcessor:
     """Handles content manipulation and structuring."""
 
@@ -573,85 +798,61 @@ class ContentProcessor:
 
     def extract_titles(self, md_content: str) -> List[str]:
         """Extract all titles from markdown content."""
-        lines = md_content.split("\n")
-        titles = []
-        for line in lines:
-            if line.startswith("#"):
-                title = line.lstrip("#").strip()
-                titles.append(title)
-        return titles
+        return [title.strip() for title in _TITLE_RE.findall(md_content)]
 
     def count_paragraphs(self, md_text: str) -> int:
         """Count the number of paragraphs in markdown text."""
-        md_text = md_text.strip()
-        blocks = re.split(r'\n\s*\n', md_text)
-        paragraphs = [b for b in blocks if b.strip()]
-        return len(paragraphs)
+        return sum(1 for b in _PARA_SPLIT.split(md_text.strip()) if b.strip())
 
     def remove_redundant_title(self, md_content: str, file_name: str) -> str:
         """Remove redundant title that matches filename."""
-        normalized_filename = file_name.replace("-", " ").replace("_", " ")
-        lines = md_content.split("\n")
+        normalized_filename = file_name.translate(_FILENAME_NORMALIZE).lower()
 
-        if not lines or not lines[0].startswith("# "):
-            logger.info(f"No redundant title found in '{file_name}'")
-            return md_content
-
-        title_text = lines[0].lstrip("# ").strip()
-        if normalized_filename.lower() != title_text.lower():
+        # Only the first line decides whether anything changes, so check it
+        # before splitting the whole document
+        first_line = md_content.partition("\n")[0]
+        if not first_line.startswith("# ") or first_line.lstrip("# ").strip().lower() != normalized_filename:
             logger.info(f"No redundant title found in '{file_name}'")
             return md_content
 
         logger.info(f"Found and removing redundant title in '{file_name}'")
+        lines = md_content.split("\n")
 
         # Remove the first line and any empty lines following it
-        remaining_lines = lines[1:]
-        while remaining_lines and remaining_lines[0].strip() == "":
-            remaining_lines.pop(0)
-
-        # Check heading levels in remaining content
-        heading_levels_found = set()
-        for line in remaining_lines:
-            stripped_line = line.lstrip()
-            if stripped_line.startswith("#"):
-                level = 0
-                while level < len(stripped_line) and stripped_line[level] == "#":
-                    level += 1
-                heading_levels_found.add(level)
-
-        # Promote headings if multiple levels found
-        final_lines = []
-        if len(heading_levels_found) > 1:
-            logger.info("Multiple heading levels found. Promoting subsequent headings by one level.")
-            for line in remaining_lines:
-                stripped_line = line.lstrip()
-                if stripped_line.startswith("##"):
-                    first_hash_index = line.find("#")
-                    new_line = line[:first_hash_index] + line[first_hash_index + 1:]
-                    final_lines.append(new_line)
-                else:
-                    final_lines.append(line)
-        else:
+        start = 1
+        while start < len(lines) and not lines[start].strip():
+            start += 1
+        remaining_lines = lines[start:]
+        remaining_content = "\n".join(remaining_lines)
+
+        # Check heading levels in remaining content, one bit per level
+        heading_level_mask = 0
+        for hashes in _HEADING_LEVEL_RE.findall(remaining_content):
+            heading_level_mask |= 1 << len(hashes)
+
+        # Promote headings if multiple levels found (more than one bit set)
+        if not heading_level_mask & (heading_level_mask - 1):
             logger.info("No promotion needed (headings are uniform or absent).")
-            final_lines = remaining_lines
+            return remaining_content
+
+        logger.info("Multiple heading levels found. Promoting subsequent headings by one level.")
+        return "\n".join(
+            line.replace("#", "", 1) if line.lstrip().startswith("##") else line
+            for line in remaining_lines
+        )
 
-        return "\n".join(final_lines)
+    def analyze(self, md_content: str, file_name: str) -> MarkdownAnalysis:
+        """Remove the redundant title, then count paragraphs."""
+        content = self.remove_redundant_title(md_content, file_name)
+        return MarkdownAnalysis(content, self.count_paragraphs(content))
 
     def fix_title_levels(self, mapping_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Fix title levels in the mapping list to ensure they are sequential."""
-        last_level = 0
-        for i in range(len(mapping_list)):
-            current_level = mapping_list[i]["level_of_title"]
-            mapping_list[i]['title'] = mapping_list[i]['title'].strip()
+        levels = _shift_title_levels([mapping["level_of_title"] for mapping in mapping_list])
 
-            if current_level > last_level + 1:
-                diff = current_level - (last_level + 1)
-                j = i
-                while j < len(mapping_list) and mapping_list[j]["level_of_title"] >= current_level:
-                    mapping_list[j]["level_of_title"] -= diff
-                    j += 1
-
-            last_level = mapping_list[i]["level_of_title"]
+        for mapping, level in zip(mapping_list, levels):
+            mapping['title'] = mapping['title'].strip()
+            mapping["level_of_title"] = level
 
         return mapping_list
 
@@ -662,51 +863,48 @@ class ContentProcessor:
     ) -> str:
         """Apply structure to content without titles."""
         original_paragraphs = [p.strip() for p in md_content.split("\n\n") if p.strip()]
+        paragraph_total = len(original_paragraphs)
         md_parts = []
-        content_dict['titles_with_levels'] = []
+        titles_with_levels = content_dict['titles_with_levels'] = []
 
         # Get section starts if they exist
         section_starts = {}
         if 'sections' in content_dict:
             section_starts = {
-                s["start_paragraph_index"]: s["section_title"]
+                s["start_paragraph_index"]: s["section_title"].strip()
                 for s in content_dict.get("sections", [])
             }
 
+        # Paragraph titles nest under section titles when sections exist
+        paragraph_level = 2 if section_starts else 1
+        paragraph_prefix = "#" * paragraph_level
+
         # Process paragraphs
-        for paragraph in sorted(
-            content_dict["paragraphs"],
-            key=lambda p: p["paragraph_index"]
-        ):
+        for paragraph in sorted(content_dict["paragraphs"], key=itemgetter("paragraph_index")):
             p_index = paragraph["paragraph_index"]
             p_title = paragraph["title"].strip()
-            level = 1
 
             # Add section title if this paragraph starts a new section
-            if p_index in section_starts:
-                title = section_starts[p_index].strip()
-                md_parts.append(f"# {title}\n\n")
-                content_dict['titles_with_levels'].append({
-                    "title": title,
-                    "level_of_title": level,
+            section_title = section_starts.get(p_index)
+            if section_title is not None:
+                md_parts.append(f"# {section_title}\n\n")
+                titles_with_levels.append({
+                    "title": section_title,
+                    "level_of_title": 1,
                     "paragraph_index": p_index,
                 })
 
             # Add paragraph title
-            title = p_title
-            if section_starts:
-                level = 2
-
-            md_parts.append(f"{'#' * level} {title}\n\n")
-            content_dict['titles_with_levels'].append({
-                "title": title,
-                "level_of_title": level,
+            md_parts.append(f"{paragraph_prefix} {p_title}\n\n")
+            titles_with_levels.append({
+                "title": p_title,
+                "level_of_title": paragraph_level,
                 "paragraph_index": p_index,
             })
 
             # Add paragraph content
             content_index = p_index - 1  # Convert to 0-based index
-            if content_index < len(original_paragraphs):
+            if content_index < paragraph_total:
                 md_parts.append(f"{original_paragraphs[content_index]}\n\n")
 
         return "".join(md_parts)
@@ -722,20 +920,16 @@ class ContentProcessor:
 
         i = 0
         lines = md_content.split("\n")
-        title_pattern = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<title>\S.*?)$")
+        mapping_title_set = {d['title'] for d in mapping_list}
         new_lines = []
 
         for line in lines:
-            match = title_pattern.match(line.strip())
+            match = _MD_TITLE_RE.match(line.strip())
             if match and i < len(mapping_list):
                 raw_title = match.group("title").strip()
                 # Check if title is in mapping list
-                title_variations = [
-                    raw_title.replace('"', "'"),
-                    raw_title
-                ]
-
-                if any(v in [d['title'] for d in mapping_list] for v in title_variations):
+                if (raw_title in mapping_title_set
+                        or raw_title.replace('"', "'") in mapping_title_set):
                     new_level = mapping_list[i]["level_of_title"]
                     new_lines.append(f"{'#' * new_level} {raw_title}")
                     i += 1
@@ -753,21 +947,24 @@ class ContentProcessor:
         title_list: List[str]
     ) -> Dict[str, Any]:
         """Remove key concepts that don't have valid source_section_titles."""
+        title_set = set(title_list)
         valid_concepts = []
         removed_concepts = []
 
         for concept in content_dict.get('key_concepts', []):
             source_title = concept.get('source_section_title', '')
-            if source_title in title_list:
+            if source_title in title_set:
                 valid_concepts.append(concept)
             else:
                 removed_concepts.append(source_title)
-                logger.info(f"Removed invalid concept with title: '{source_title}'")
 
         content_dict['key_concepts'] = valid_concepts
 
         if removed_concepts:
-            logger.info(f"Total removed concepts: {len(removed_concepts)}")
+            logger.info(
+                f"Total removed concepts: {len(removed_concepts)} "
+                f"(invalid titles: {removed_concepts})"
+            )
 
         return content_dict
 
@@ -779,8 +976,9 @@ class ContentProcessor:
 class SpeakerProcessor:
     """Handles speaker role assignment and management."""
 
-    def __init__(self):
+    def __init__(self, config: Optional[ProcessingConfig] = None):
         """Initialize speaker processor."""
+        self.config = config or ProcessingConfig()
         self.role_patterns = {
             "name_introduction": [
                 r"I am (\w+)",
@@ -820,22 +1018,14 @@ class SpeakerProcessor:
             for speaker in speakers_mapping
         }
 
-        updated_content = md_content
-
-        # Replace speaker IDs in markdown
-        for speaker_id, role in speaker_role_map.items():
-            # Replace patterns like "Speaker_00:" with role
-            pattern = rf'\b{re.escape(speaker_id)}:'
-            replacement = f'{role}:'
-            updated_content = re.sub(pattern, replacement, updated_content)
-
-            # Also replace bold patterns
-            pattern_bold = rf'\*\*{re.escape(speaker_id)}:\*\*'
-            replacement_bold = f'**{role}:**'
-            updated_content = re.sub(pattern_bold, replacement_bold, updated_content)
+        # Replace patterns like "Speaker_00:" (plain or bold) with role in a single pass
+        pattern = _speaker_id_pattern(tuple(sorted(speaker_role_map)))
+        updated_content = pattern.sub(
+            lambda match: f"{speaker_role_map[match.group(1)]}:", md_content
+        )
 
         # Update JSON file if provided
-        if json_file_path and os.path.exists(json_file_path):
+        if json_file_path:
             self._update_speakers_in_json(json_file_path, speaker_role_map)
 
         logger.info(f"Updated speakers: {', '.join([f'{k} -> {v}' for k, v in speaker_role_map.items()])}")
@@ -848,8 +1038,7 @@ class SpeakerProcessor:
     ) -> None:
         """Update speaker IDs in JSON transcript file."""
         try:
-            with open(json_file_path, "r") as json_file:
-                transcript_data = json.load(json_file)
+            transcript_data = _load_json_file(json_file_path)
 
             updated_count = 0
             for entry in transcript_data:
@@ -858,11 +1047,12 @@ class SpeakerProcessor:
                     entry["speaker"] = speaker_role_map[old_speaker]
                     updated_count += 1
 
-            with open(json_file_path, "w") as json_file:
-                json.dump(transcript_data, json_file, indent=4)
+            _dump_json_file(json_file_path, transcript_data, pretty=self.config.pretty_json, indent=4)
 
             logger.info(f"Updated {updated_count} speaker entries in JSON file: {json_file_path}")
 
+        except FileNotFoundError:
+            logger.warning(f"JSON transcript file not found, skipping speaker update: {json_file_path}")
         except Exception as e:
             logger.error(f"Error updating speakers in JSON file {json_file_path}: {str(e)}")
 
@@ -915,37 +1105,43 @@ class TranscriptManager:
             json_file_path: Path to the JSON file containing transcript
             index_helper: Dictionary with title as key and start time as value
         """
-        with open(json_file_path, "r") as json_file:
-            transcript_list = json.load(json_file)
-
-        # Convert index_helper to list of tuples
-        titles_to_insert = [
-            (title, start_time[0])
-            for title, start_time in index_helper.items()
-        ]
-        titles_to_insert.sort(key=lambda x: float(x[1]))
-
-        current_index = 0
-        for title, start_time in titles_to_insert:
-            # Find insertion position
-            while (current_index < len(transcript_list) and
-                   float(transcript_list[current_index]["start time"]) < float(start_time)):
-                current_index += 1
-
-            # Create title entry
-            title_entry = {
-                "start time": float(start_time),
-                "end time": float(start_time),
-                "speaker": f"title-{len(title)}",
-                "text content": f"{title[-1]}"
-            }
-
-            transcript_list.insert(current_index, title_entry)
-            current_index += 1
+        transcript_list = self._insert_titles(_load_json_file(json_file_path), index_helper)
 
         # Save updated transcript
-        with open(json_file_path, "w") as json_file:
-            json.dump(transcript_list, json_file, indent=4)
+        _dump_json_file(json_file_path, transcript_list, pretty=self.config.pretty_json)
+
+    def _insert_titles(
+        self,
+        transcript_list: List[Dict[str, Any]],
+        index_helper: Dict[str, List[float]]
+    ) -> List[Dict[str, Any]]:
+        """Return the transcript with a title entry placed before each titled segment."""
+        titles = list(index_helper)
+        title_times = np.array(
+            [float(start_time[0]) for start_time in index_helper.values()],
+            dtype=np.float64
+        )
+        order = np.argsort(title_times, kind="stable")
+
+        # A title goes before the first entry starting at or after it. Searching the
+        # running maximum finds that entry even if the transcript is not time-ordered.
+        positions = np.searchsorted(_start_time_keys(transcript_list), title_times[order], side="left")
+
+        merged = []
+        previous = 0
+        for position, title_index in zip(positions.tolist(), order.tolist()):
+            title = titles[title_index]
+            start_time = float(title_times[title_index])
+            merged.extend(transcript_list[previous:position])
+            merged.append({
+                "start time": start_time,
+                "end time": start_time,
+                "speaker": f"title-{len(title)}",
+                "text content": f"{title[-1]}"
+            })
+            previous = position
+        merged.extend(transcript_list[previous:])
+        return merged
 
     def group_sentences_in_transcript(
         self,
@@ -963,84 +1159,17 @@ class TranscriptManager:
             Path to the output file
         """
         try:
-            with open(json_file_path, "r") as json_file:
-                transcript_data = json.load(json_file)
+            # Large files are streamed so the raw entry dicts are never all held at once
+            original_count, groups = self._group_sentences(_iter_json_array(json_file_path))
 
-            if not transcript_data:
+            if not original_count:
                 logger.warning(f"Empty transcript data in {json_file_path}")
                 return json_file_path
 
-            grouped_transcript = []
-            current_group = None
-
-            for entry in transcript_data:
-                # Null-safety: Skip entries with invalid timestamps
-                start_time_raw = entry.get("start time")
-                end_time_raw = entry.get("end time")
-
-                if start_time_raw is None or end_time_raw is None:
-                    logger.warning(
-                        f"Skipping transcript entry with null timestamp: "
-                        f"start={start_time_raw}, end={end_time_raw}, "
-                        f"speaker={entry.get('speaker', 'N/A')}"
-                    )
-                    continue
-
-                try:
-                    start_time = float(start_time_raw)
-                    end_time = float(end_time_raw)
-                except (TypeError, ValueError) as e:
-                    logger.warning(
-                        f"Skipping transcript entry with invalid timestamp: {e}, "
-                        f"start={start_time_raw}, end={end_time_raw}"
-                    )
-                    continue
-
-                speaker = entry.get("speaker", "")
-                text_content = entry.get("text content", "").strip()
-
-                if not text_content:
-                    continue
-
-                # Check if entry is a title
-                is_title = speaker.startswith("title-")
-
-                # Determine if we can add to current group
-                if current_group is None:
-                    current_group = self._create_group_entry(
-                        start_time, end_time, speaker, text_content
-                    )
-                elif self._should_start_new_group(
-                    current_group, entry, is_title
-                ):
-                    grouped_transcript.append(current_group)
-                    current_group = self._create_group_entry(
-                        start_time, end_time, speaker, text_content
-                    )
-                else:
-                    # Add to current group
-                    combined_text = f"{current_group['text content']} {text_content}"
-                    current_group["text content"] = combined_text
-                    current_group["end time"] = end_time
-
-            # Add the last group
-            if current_group is not None:
-                grouped_transcript.append(current_group)
-
-            # Write output
+            # Write output, emitting each group as it is built
             output_file_path = output_path if output_path else json_file_path
-            with open(output_file_path, "w") as json_file:
-                json.dump(grouped_transcript, json_file, indent=4)
-
-            # Log statistics
-            original_count = len(transcript_data)
-            grouped_count = len(grouped_transcript)
-            reduction_percent = ((original_count - grouped_count) / original_count * 100) if original_count > 0 else 0
-
-            logger.info(
-                f"Grouped transcript sentences: {original_count} -> {grouped_count} "
-                f"({reduction_percent:.1f}% reduction) in {output_file_path}"
-            )
+            grouped_count = _dump_json_array(output_file_path, groups, pretty=self.config.pretty_json)
+            self._log_grouping(original_count, grouped_count, output_file_path)
 
             return output_file_path
 
@@ -1048,48 +1177,151 @@ class TranscriptManager:
             logger.error(f"Error grouping sentences in transcript {json_file_path}: {str(e)}")
             return json_file_path
 
-    def _create_group_entry(
+    def process_transcript(
         self,
-        start_time: float,
-        end_time: float,
-        speaker: str,
-        text_content: str
-    ) -> Dict[str, Any]:
-        """Create a new group entry."""
-        return {
-            "start time": start_time,
-            "end time": end_time,
-            "speaker": speaker,
-            "text content": text_content
-        }
+        json_file_path: str,
+        index_helper: Optional[Dict[str, List[float]]] = None,
+        group: bool = True,
+        output_path: Optional[str] = None
+    ) -> str:
+        """
+        Add titles to and group a transcript with a single read and write.
 
-    def _should_start_new_group(
-        self,
-        current_group: Dict[str, Any],
-        entry: Dict[str, Any],
-        is_title: bool
-    ) -> bool:
-        """Determine if a new group should be started."""
-        # Titles should never be grouped
-        if is_title or current_group.get("speaker", "").startswith("title-"):
-            return True
+        This does the work of add_titles_to_transcript followed by
+        group_sentences_in_transcript without writing the file in between.
+        If the file cannot be read it is left untouched. If adding titles
+        fails the transcript is processed without them, and if grouping
+        fails it is written ungrouped.
+
+        Args:
+            json_file_path: Path to the JSON transcript file
+            index_helper: Optional titles to insert, as for add_titles_to_transcript
+            group: Whether to group sentences after inserting titles
+            output_path: Optional output path for the processed JSON
+
+        Returns:
+            Path to the output file
+        """
+        try:
+            transcript_list = _load_json_file(json_file_path)
+        except Exception as e:
+            logger.error(f"Error reading transcript {json_file_path}: {str(e)}")
+            return json_file_path
 
-        # Different speaker
-        if current_group["speaker"] != entry.get("speaker", ""):
-            return True
+        if index_helper:
+            try:
+                transcript_list = self._insert_titles(transcript_list, index_helper)
+            except Exception as e:
+                logger.error(f"Error adding titles to transcript {json_file_path}: {str(e)}")
+
+        output_file_path = output_path if output_path else json_file_path
+        if group:
+            try:
+                original_count, groups = self._group_sentences(transcript_list)
+                grouped_count = _dump_json_array(output_file_path, groups, pretty=self.config.pretty_json)
+                self._log_grouping(original_count, grouped_count, output_file_path)
+                return output_file_path
+            except Exception as e:
+                logger.error(f"Error grouping sentences in transcript {json_file_path}: {str(e)}")
+
+        _dump_json_file(output_file_path, transcript_list, pretty=self.config.pretty_json)
+        return output_file_path
+
+    def _group_sentences(
+        self,
+        transcript_data: Iterable[Dict[str, Any]]
+    ) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Group transcript entries without any file I/O.
 
-        # Time gap too large
-        start_time = float(entry.get("start time", 0))
-        if (start_time - float(current_group["end time"])) > self.config.max_time_gap_seconds:
-            return True
+        Consumes transcript_data and returns how many entries it held along
+        with a lazy iterator over the grouped entries.
+        """
+        # Parse each usable entry once into parallel columns
+        starts, ends, speakers, texts = [], [], [], []
+        speaker_ids, is_titles, word_counts = [], [], []
+        speaker_map: Dict[str, int] = {}
+        speaker_is_title: List[bool] = []
+        original_count = 0
+
+        for entry in transcript_data:
+            original_count += 1
+            # Null-safety: Skip entries with invalid timestamps
+            start_time_raw = entry.get("start time")
+            end_time_raw = entry.get("end time")
+
+            if start_time_raw is None or end_time_raw is None:
+                logger.warning(
+                    f"Skipping transcript entry with null timestamp: "
+                    f"start={start_time_raw}, end={end_time_raw}, "
+                    f"speaker={entry.get('speaker', 'N/A')}"
+                )
+                continue
+
+            try:
+                start_time = float(start_time_raw)
+                end_time = float(end_time_raw)
+            except (TypeError, ValueError) as e:
+                logger.warning(
+                    f"Skipping transcript entry with invalid timestamp: {e}, "
+                    f"start={start_time_raw}, end={end_time_raw}"
+                )
+                continue
+
+            speaker = entry.get("speaker", "")
+            text_content = entry.get("text content", "").strip()
+
+            if not text_content:
+                continue
+
+            # Interning lets every group share one string per speaker;
+            # each distinct speaker is classified only once
+            speaker = sys.intern(speaker)
+            speaker_id = speaker_map.get(speaker)
+            if speaker_id is None:
+                speaker_id = speaker_map[speaker] = len(speaker_map)
+                speaker_is_title.append(speaker.startswith("title-"))
+
+            starts.append(start_time)
+            ends.append(end_time)
+            speakers.append(speaker)
+            texts.append(text_content)
+            speaker_ids.append(speaker_id)
+            is_titles.append(speaker_is_title[speaker_id])
+            word_counts.append(len(text_content.split()))
+
+        boundaries = []
+        if texts:
+            boundaries = _group_boundaries(
+                np.array(starts, dtype=np.float64),
+                np.array(ends, dtype=np.float64),
+                np.array(speaker_ids, dtype=np.int64),
+                np.array(is_titles, dtype=np.bool_),
+                np.array(word_counts, dtype=np.int64),
+                float(self.config.max_time_gap_seconds),
+                int(self.config.max_words_per_group)
+            ).tolist()
+            boundaries.append(len(texts))
+
+        return original_count, (
+            {
+                "start time": starts[first],
+                "end time": ends[stop - 1],
+                "speaker": speakers[first],
+                "text content": " ".join(texts[first:stop])
+            }
+            for first, stop in zip(boundaries, boundaries[1:])
+        )
 
-        # Word limit check
-        combined_text = f"{current_group['text content']} {entry.get('text content', '')}"
-        word_count = len(combined_text.split())
-        if word_count > self.config.max_words_per_group:
-            return True
+    @staticmethod
+    def _log_grouping(original_count: int, grouped_count: int, output_file_path: str) -> None:
+        """Log how much grouping shortened a transcript."""
+        reduction_percent = ((original_count - grouped_count) / original_count * 100) if original_count > 0 else 0
 
-        return False
+        logger.info(
+            f"Grouped transcript sentences: {original_count} -> {grouped_count} "
+            f"({reduction_percent:.1f}% reduction) in {output_file_path}"
+        )
 
 
 # ========================
@@ -1106,30 +1338,19 @@ class PromptBuilder:
         '            Counter-example: Do NOT mention topics like "lists" or "functions" if they are only used as illustrative examples for the main topic.'
     )
 
-    def __init__(self, config: Optional[ProcessingConfig] = None):
-        """Initialize prompt builder with configuration."""
-        self.config = config or ProcessingConfig()
-
-    def build_ipynb_prompt(
-        self,
-        course_name: str,
-        file_name: str
-    ) -> str:
-        """Build prompt for ipynb content processing."""
-        return dedent(
-            f"""You are an expert AI assistant specializing in analyzing and structuring educational material.
+    _IPYNB_TEMPLATE = """You are an expert AI assistant specializing in analyzing and structuring educational material.
             You will be given markdown content from a video in the course "{course_name}", from the file "{file_name}".
             Your task is to perform the following actions and format the output as a single JSON object:
 
             ### Part 0: Generate File Description
-            {self.FILE_DESCRIPTION_PROMPT}
+            {file_description}
 
             ### Part 1: Extract Key Concepts
             Your goal is to create a high-level summary of the entire document by identifying a small, curated set of its most important concepts.
 
             CRITICAL CONSTRAINTS - YOU MUST FOLLOW:
             1. **Strict One-to-One Mapping:** Each Source Section title MUST map to exactly ONE Key Concept.
-            2. **Limited Quantity:** Aggressively merge and consolidate topics. The final count must always be less than {self.config.max_key_concepts}.
+            2. **Limited Quantity:** Aggressively merge and consolidate topics. The final count must always be less than {max_key_concepts}.
             3. **No Hierarchical Overlap:** Cannot choose both a main section and its sub-section.
             4. **Concise Concepts:** Short keyword phrases or level-1 section titles. NOT full sentences.
             5. **Analyze with Aspects:** For each key concept, provide multiple detailed analytical descriptions from different perspectives (e.g., definition, examples, use cases, implications). Each aspect should be a longer description analyzing the concept thoroughly.
@@ -1144,7 +1365,7 @@ class PromptBuilder:
             - **Sub-problems:** Create exactly 2 sub-problems as multiple choice questions
 
             ### Part 3: Generate Comprehensive Recap Questions
-            Create up to {self.config.max_recap_questions} recap questions (0–{self.config.max_recap_questions}, only meaningful ones).
+            Create up to {max_recap_questions} recap questions (0–{max_recap_questions}, only meaningful ones).
 
             Design principles:
             - **Recap, not add-on:** Use document's terminology and scope
@@ -1153,35 +1374,15 @@ class PromptBuilder:
             - **Concept integration:** Connect 2–3 core ideas when reasonable
 
             Format your response as a valid JSON object matching the provided schema."""
-        )
-
-    def build_no_title_prompt(
-        self,
-        course_name: str,
-        file_name: str,
-        paragraph_count: int
-    ) -> str:
-        """Build prompt for content without titles."""
-        if paragraph_count > self.config.min_paragraphs_for_sections:
-            return self._build_multi_paragraph_prompt(course_name, file_name)
-        else:
-            return self._build_few_paragraph_prompt(course_name, file_name)
 
-    def _build_multi_paragraph_prompt(
-        self,
-        course_name: str,
-        file_name: str
-    ) -> str:
-        """Build prompt for content with multiple paragraphs."""
-        return dedent(
-            f"""You are an expert AI assistant specializing in analyzing and structuring educational material.
+    _MULTI_PARAGRAPH_TEMPLATE = """You are an expert AI assistant specializing in analyzing and structuring educational material.
             You will be given markdown content from a video in the course "{course_name}", from the file "{file_name}".
 
             ### Part 0: Generate File Description
-            {self.FILE_DESCRIPTION_PROMPT}
+            {file_description}
 
             ### Part 1: Structure the Content
-            1. **Group into Sections:** Divide the text into 3-{self.config.max_sections} logical sections.
+            1. **Group into Sections:** Divide the text into 3-{max_sections} logical sections.
             2. **Generate Titles:** Create concise, descriptive titles for sections and paragraphs.
             3. **Create Nested Structure:** Organize with section titles and nested paragraph arrays.
 
@@ -1194,7 +1395,7 @@ class PromptBuilder:
             - Follow the same constraints as the standard key concept extraction.
 
             ### Part 3: Generate Recap Questions
-            Create up to {self.config.max_recap_questions} meaningful recap questions for review.
+            Create up to {max_recap_questions} meaningful recap questions for review.
 
             ### Part 4: Identify and Classify Speakers
             Analyze speaker tags (Speaker_00, etc.) and determine roles:
@@ -1202,20 +1403,12 @@ class PromptBuilder:
             - If no names, classify as Professor (only one), TA_N, Student_N, Unknown_N
 
             Format your response as a valid JSON object matching the provided schema."""
-        )
 
-    def _build_few_paragraph_prompt(
-        self,
-        course_name: str,
-        file_name: str
-    ) -> str:
-        """Build prompt for content with few paragraphs."""
-        return dedent(
-            f"""You are an expert AI assistant specializing in analyzing and structuring educational material.
+    _FEW_PARAGRAPH_TEMPLATE = """You are an expert AI assistant specializing in analyzing and structuring educational material.
             You will be given markdown content from a video in the course "{course_name}", from the file "{file_name}".
 
             ### Part 0: Generate File Description
-            {self.FILE_DESCRIPTION_PROMPT}
+            {file_description}
 
             ### Part 1: Structure the Content
             **Generate Titles:** Create one concise, descriptive title for each paragraph.
@@ -1226,30 +1419,21 @@ class PromptBuilder:
             CRITICAL CONSTRAINTS:
             - **Concise Concepts:** Short keyword phrases or level-1 section titles (e.g., 'conda activate yk_env', 'recursion tree'). NOT full sentences.
             - **Analyze with Aspects:** For each key concept, provide multiple detailed analytical descriptions from different perspectives (e.g., definition, examples, use cases, implications). Each aspect should be a longer description analyzing the concept thoroughly.
-            - Maximum {self.config.max_key_concepts} concepts, following standard constraints.
+            - Maximum {max_key_concepts} concepts, following standard constraints.
 
             ### Part 3: Generate Recap Questions
-            Create up to {self.config.max_recap_questions} meaningful recap questions.
+            Create up to {max_recap_questions} meaningful recap questions.
 
             ### Part 4: Identify and Classify Speakers
             Analyze and classify speakers, prioritizing actual names if mentioned.
 
             Format your response as a valid JSON object matching the provided schema."""
-        )
 
-    def build_one_title_level_prompt(
-        self,
-        course_name: str,
-        file_name: str,
-        title_list: List[str],
-    ) -> str:
-        """Build prompt for content with one title level."""
-        return dedent(
-            f"""You are an expert AI assistant for structuring educational material.
+    _ONE_TITLE_LEVEL_TEMPLATE = """You are an expert AI assistant for structuring educational material.
             You will be given markdown content from the file "{file_name}" for the course "{course_name}".
 
             ### Part 0: Generate File Description
-            {self.FILE_DESCRIPTION_PROMPT}
+            {file_description}
 
             ### Part 1: Adjust Title Hierarchy Levels
             Given the title list, determine correct semantic hierarchy levels based on logical relationships.
@@ -1261,7 +1445,7 @@ class PromptBuilder:
             - Maintain logical flow relative to surrounding titles
 
             ### Part 2: Extract High-Level Key Concepts
-            Create a high-level summary with {self.config.max_key_concepts} or fewer key concepts.
+            Create a high-level summary with {max_key_concepts} or fewer key concepts.
 
             CRITICAL CONSTRAINTS:
             - **Concise Concepts:** Short keyword phrases or level-1 section titles. NOT full sentences.
@@ -1269,23 +1453,19 @@ class PromptBuilder:
             - Follow standard key concept extraction constraints.
 
             ### Part 3: Generate Recap Questions
-            Create up to {self.config.max_recap_questions} meaningful recap questions.
+            Create up to {max_recap_questions} meaningful recap questions.
 
             Format your response as a valid JSON object matching the provided schema."""
-        )
 
-    def build_key_concepts_only_prompt(self) -> str:
-        """Build prompt for extracting only key concepts."""
-        return dedent(
-            f"""Extract High-Level Key Concepts for Overview
+    _KEY_CONCEPTS_ONLY_TEMPLATE = """Extract High-Level Key Concepts for Overview
             Your goal is to create a high-level summary by identifying the most important concepts.
 
             ### Generate File Description
-            {self.FILE_DESCRIPTION_PROMPT}
+            {file_description}
 
             CRITICAL CONSTRAINTS:
             1. **Strict One-to-One Mapping:** Each Source Section maps to exactly ONE Key Concept
-            2. **Limited Quantity:** Maximum {self.config.max_key_concepts} concepts
+            2. **Limited Quantity:** Maximum {max_key_concepts} concepts
             3. **No Hierarchical Overlap:** Cannot choose both main and sub-sections
             4. **Concise Concepts:** Short keyword phrases or level-1 section titles. NOT full sentences.
             5. **Analyze with Aspects:** For each key concept, provide multiple detailed analytical descriptions from different perspectives (e.g., definition, examples, use cases, implications). Each aspect should be a longer description analyzing the concept thoroughly.
@@ -1293,7 +1473,7 @@ class PromptBuilder:
             7. **Generate Check-in Questions:** Create challenging assessment questions
 
             ### Generate Comprehensive Recap Questions
-            Create up to {self.config.max_recap_questions} meaningful recap questions for review.
+            Create up to {max_recap_questions} meaningful recap questions for review.
 
             Design principles:
             - **Recap, not add-on:** Use document's terminology
@@ -1302,7 +1482,75 @@ class PromptBuilder:
             - **Concept integration:** Connect 2-3 core ideas
 
             Format your response as a valid JSON object matching the provided schema."""
-        )
+
+    def __init__(self, config: Optional[ProcessingConfig] = None):
+        """Initialize prompt builder with configuration."""
+        self.config = config or ProcessingConfig()
+
+        # Render the config-dependent parts once; only course and file names are
+        # left as placeholders to fill in per call.
+        fields = {
+            "file_description": self.FILE_DESCRIPTION_PROMPT,
+            "max_key_concepts": self.config.max_key_concepts,
+            "max_recap_questions": self.config.max_recap_questions,
+            "max_sections": self.config.max_sections,
+            "course_name": "{course_name}",
+            "file_name": "{file_name}",
+        }
+        self._ipynb_template = dedent(self._IPYNB_TEMPLATE).format_map(fields)
+        self._multi_paragraph_template = dedent(self._MULTI_PARAGRAPH_TEMPLATE).format_map(fields)
+        self._few_paragraph_template = dedent(self._FEW_PARAGRAPH_TEMPLATE).format_map(fields)
+        self._one_title_level_template = dedent(self._ONE_TITLE_LEVEL_TEMPLATE).format_map(fields)
+        self._key_concepts_only_template = dedent(self._KEY_CONCEPTS_ONLY_TEMPLATE).format_map(fields)
+
+    def build_ipynb_prompt(
+        self,
+        course_name: str,
+        file_name: str
+    ) -> str:
+        """Build prompt for ipynb content processing."""
+        return self._ipynb_template.format(course_name=course_name, file_name=file_name)
+
+    def build_no_title_prompt(
+        self,
+        course_name: str,
+        file_name: str,
+        paragraph_count: int
+    ) -> str:
+        """Build prompt for content without titles."""
+        if paragraph_count > self.config.min_paragraphs_for_sections:
+            return self._build_multi_paragraph_prompt(course_name, file_name)
+        else:
+            return self._build_few_paragraph_prompt(course_name, file_name)
+
+    def _build_multi_paragraph_prompt(
+        self,
+        course_name: str,
+        file_name: str
+    ) -> str:
+        """Build prompt for content with multiple paragraphs."""
+        return self._multi_paragraph_template.format(course_name=course_name, file_name=file_name)
+
+    def _build_few_paragraph_prompt(
+        self,
+        course_name: str,
+        file_name: str
+    ) -> str:
+        """Build prompt for content with few paragraphs."""
+        return self._few_paragraph_template.format(course_name=course_name, file_name=file_name)
+
+    def build_one_title_level_prompt(
+        self,
+        course_name: str,
+        file_name: str,
+        title_list: List[str],
+    ) -> str:
+        """Build prompt for content with one title level."""
+        return self._one_title_level_template.format(course_name=course_name, file_name=file_name)
+
+    def build_key_concepts_only_prompt(self) -> str:
+        """Build prompt for extracting only key concepts."""
+        return self._key_concepts_only_template
 
 
 # ========================
@@ -1330,7 +1578,7 @@ class TitleHandler:
 
         self.schema_factory = SchemaFactory(self.config)
         self.content_processor = ContentProcessor(self.config)
-        self.speaker_processor = SpeakerProcessor()
+        self.speaker_processor = SpeakerProcessor(self.config)
         self.transcript_manager = TranscriptManager(self.config)
         self.prompt_builder = PromptBuilder(self.config)
 
@@ -1398,12 +1646,12 @@ class TitleHandler:
             raise ValueError("The content is empty or not properly formatted.")
 
         # Process content
-        md_content = self.content_processor.remove_redundant_title(md_content, file_name)
+        analysis = self.content_processor.analyze(md_content, file_name)
+        md_content = analysis.content
         title_list = self._prepare_title_list(index_helper)
 
         # Check for single title, single paragraph case
-        paragraph_count = self.content_processor.count_paragraphs(md_content)
-        if len(title_list) == 1 and paragraph_count == 1:
+        if len(title_list) == 1 and analysis.paragraph_count == 1:
             return {
                 "titles_with_levels": [{
                     "title": title_list[0],
@@ -1461,15 +1709,14 @@ class TitleHandler:
         return content_dict
 
     def _prepare_title_list(self, index_helper: Optional[Dict[str, Any]]) -> List[str]:
-        """Prepare title list from index helper."""
+        """Prepare title list from index helper (a list of dicts, or one dict)."""
         if not index_helper:
             return []
 
-        return [
-            key.replace('"', "'")
-            for d in index_helper
-            for key in d.keys()
-        ]
+        # str.replace returns the key itself when there is no quote to swap
+        if isinstance(index_helper, dict):
+            return [key.replace('"', "'") for key in index_helper]
+        return [key.replace('"', "'") for d in index_helper for key in d]
 
     def save_key_concepts_to_metadata(
         self,
@@ -1480,7 +1727,7 @@ class TitleHandler:
         # Load existing metadata or create new
         if metadata_path.exists():
             with open(metadata_path, "r") as metadata_file:
-                data = yaml.safe_load(metadata_file) or {}
+                data = yaml.load(metadata_file, Loader=YamlLoader) or {}
         else:
             logger.warning("No metadata file exists, creating a new one.")
             metadata_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1495,14 +1742,44 @@ class TitleHandler:
             data["key_concept"] = key_concepts
 
         # Save metadata
-        with open(metadata_path, "w") as metadata_file:
-            yaml.safe_dump(data, metadata_file, default_flow_style=False)
+        with _atomic_open(metadata_path, "w") as metadata_file:
+            yaml.dump(data, metadata_file, Dumper=YamlDumper, default_flow_style=False)
 
 
 # ========================
 # Public API Functions
 # ========================
 
+@lru_cache(maxsize=8)
+def _get_handler(api_key: Optional[str] = None, use_openai: bool = True) -> "TitleHandler":
+    """Return a TitleHandler shared across public API calls with the same arguments."""
+    return TitleHandler(api_key, use_openai=use_openai)
+
+
+@lru_cache(maxsize=1)
+def _get_processor() -> ContentProcessor:
+    """Return the ContentProcessor shared by the stateless content helpers."""
+    return ContentProcessor()
+
+
+@lru_cache(maxsize=1)
+def _get_speaker_processor() -> SpeakerProcessor:
+    """Return the SpeakerProcessor shared by the speaker helpers."""
+    return SpeakerProcessor()
+
+
+@lru_cache(maxsize=8)
+def _get_transcript_manager(
+    max_time_gap: float = ProcessingConfig.max_time_gap_seconds,
+    max_words: int = ProcessingConfig.max_words_per_group
+) -> TranscriptManager:
+    """Return a TranscriptManager shared across calls with the same grouping limits."""
+    config = ProcessingConfig()
+    config.max_time_gap_seconds = max_time_gap
+    config.max_words_per_group = max_words
+    return TranscriptManager(config)
+
+
 def get_strutured_content_for_ipynb(
     md_content: str,
     file_name: str,
@@ -1514,9 +1791,7 @@ def get_strutured_content_for_ipynb(
 
     This is the main entry point for processing Jupyter notebook content.
     """
-    handler = TitleHandler()
-    # First get titles for validation
-    _ = handler.content_processor.extract_titles(md_content)
+    handler = _get_handler()
     return handler.process_ipynb_content(md_content, file_name, course_name, index_helper)
 
 
@@ -1530,7 +1805,7 @@ def get_structured_content_without_title(
 
     This function handles content that lacks title structure.
     """
-    handler = TitleHandler()
+    handler = _get_handler()
     return handler.process_content_without_titles(md_content, file_name, course_name)
 
 
@@ -1545,7 +1820,7 @@ def get_structured_content_with_one_title_level(
 
     This function handles content with flat title structure.
     """
-    handler = TitleHandler()
+    handler = _get_handler()
     return handler.process_content_with_one_title_level(
         md_content, file_name, course_name, index_helper
     )
@@ -1565,7 +1840,7 @@ def get_only_key_concepts(
     api_key = get_openai_api_key()
     use_openai = api_key is not None
 
-    handler = TitleHandler(use_openai=use_openai)
+    handler = _get_handler(use_openai=use_openai)
     return handler.extract_key_concepts_only(md_content, index_helper)
 
 
@@ -1575,7 +1850,7 @@ def get_title_list(md_content: str) -> List[str]:
 
     This is a utility function for title extraction.
     """
-    processor = ContentProcessor()
+    processor = _get_processor()
     return processor.extract_titles(md_content)
 
 
@@ -1585,7 +1860,7 @@ def remove_redundant_title(md_content: str, file_name: str) -> str:
 
     This is a utility function for content cleanup.
     """
-    processor = ContentProcessor()
+    processor = _get_processor()
     return processor.remove_redundant_title(md_content, file_name)
 
 
@@ -1598,7 +1873,7 @@ def remove_invalid_concepts(
 
     This is a utility function for data validation.
     """
-    processor = ContentProcessor()
+    processor = _get_processor()
     return processor.remove_invalid_concepts(content_dict, title_list)
 
 
@@ -1608,7 +1883,7 @@ def fix_title_levels(mapping_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]
 
     This is a utility function for title hierarchy correction.
     """
-    processor = ContentProcessor()
+    processor = _get_processor()
     return processor.fix_title_levels(mapping_list)
 
 
@@ -1621,7 +1896,7 @@ def apply_structure_for_no_title(
 
     This function adds titles to unstructured content.
     """
-    processor = ContentProcessor()
+    processor = _get_processor()
     return processor.apply_structure_for_no_title(md_content, content_dict)
 
 
@@ -1634,7 +1909,7 @@ def apply_structure_for_one_title(
 
     This function restructures flat title hierarchies.
     """
-    processor = ContentProcessor()
+    processor = _get_processor()
     return processor.apply_structure_for_one_title(md_content, content_dict)
 
 
@@ -1647,7 +1922,7 @@ def save_key_concept_to_metadata(
 
     This function persists key concepts for later use.
     """
-    handler = TitleHandler()
+    handler = _get_handler(use_openai=False)
     handler.save_key_concepts_to_metadata(json_dict, metadata_path)
 
 
@@ -1661,7 +1936,7 @@ def assign_speaker_roles_to_content(
 
     This function updates speaker identifiers with meaningful roles.
     """
-    processor = SpeakerProcessor()
+    processor = _get_speaker_processor()
     return processor.assign_speaker_roles(md_content, speakers_mapping, json_file_path)
 
 
@@ -1675,7 +1950,7 @@ def extract_and_assign_speakers(
 
     This is a convenience function for speaker management.
     """
-    processor = SpeakerProcessor()
+    processor = _get_speaker_processor()
     return processor.extract_and_assign_speakers(content_dict, md_content, json_file_path)
 
 
@@ -1688,7 +1963,7 @@ def add_titles_to_json(
 
     This function inserts titles at appropriate timestamps.
     """
-    manager = TranscriptManager()
+    manager = _get_transcript_manager()
     manager.add_titles_to_transcript(json_file_path, index_helper)
 
 
@@ -1703,13 +1978,28 @@ def group_sentences_in_transcript(
 
     This function consolidates transcript entries for better readability.
     """
-    config = ProcessingConfig()
-    config.max_time_gap_seconds = max_time_gap
-    config.max_words_per_group = max_words
-    manager = TranscriptManager(config)
+    manager = _get_transcript_manager(max_time_gap, max_words)
     return manager.group_sentences_in_transcript(json_file_path, output_path)
 
 
+def process_transcript(
+    json_file_path: str,
+    index_helper: Optional[Dict[str, List[float]]] = None,
+    group: bool = True,
+    max_time_gap: float = 5.0,
+    max_words: int = 200,
+    output_path: Optional[str] = None
+) -> str:
+    """
+    Add titles to and group a transcript in one pass over the file.
+
+    This replaces calling add_titles_to_json and then
+    group_sentences_in_transcript on the same file.
+    """
+    manager = _get_transcript_manager(max_time_gap, max_words)
+    return manager.process_transcript(json_file_path, index_helper, group, output_path)
+
+
 def update_speakers_in_json_file(
     json_file_path: str,
     speaker_role_map: Dict[str, str]
@@ -1719,7 +2009,7 @@ def update_speakers_in_json_file(
 
     This is a utility function for JSON transcript updates.
     """
-    processor = SpeakerProcessor()
+    processor = _get_speaker_processor()
     processor._update_speakers_in_json(json_file_path, speaker_role_map)
 
 
@@ -1734,13 +2024,11 @@ def generate_json_schema_for_no_title(
 
     This function is maintained for backwards compatibility.
     """
-    config = ProcessingConfig()
-    prompt_builder = PromptBuilder(config)
-    schema_factory = SchemaFactory(config)
+    handler = _get_handler(use_openai=False)
 
-    prompt = prompt_builder.build_no_title_prompt(course_name, file_name, paragraph_count)
-    include_sections = paragraph_count > config.min_paragraphs_for_sections
-    schema = schema_factory.create_no_title_schema(paragraph_count, include_sections)
+    prompt = handler.prompt_builder.build_no_title_prompt(course_name, file_name, paragraph_count)
+    include_sections = paragraph_count > handler.config.min_paragraphs_for_sections
+    schema = handler.schema_factory.create_no_title_schema(paragraph_count, include_sections)
 
     return prompt, schema
 
@@ -1751,21 +2039,19 @@ def paragraph_count(md_text: str) -> int:
 
     This is a utility function maintained for backwards compatibility.
     """
-    processor = ContentProcessor()
+    processor = _get_processor()
     return processor.count_paragraphs(md_text)
 
 
 # Helper functions for transcript processing
 def find_insertion_position(transcript_list: List[Dict[str, Any]], target_time: str) -> int:
-    """Find where to insert a title based on its start time."""
-    target_seconds = float(target_time)
-
-    for i, entry in enumerate(transcript_list):
-        entry_start_seconds = float(entry["start time"])
-        if entry_start_seconds >= target_seconds:
-            return i
+    """
+    Find where to insert a title based on its start time.
 
-    return len(transcript_list)
+    Uses the same placement as TranscriptManager, so entries with invalid
+    start times are skipped.
+    """
+    return int(np.searchsorted(_start_time_keys(transcript_list), float(target_time), side="left"))
 
 
 def get_previous_end_time(transcript_list: List[Dict[str, Any]], position: int) -> float:
@@ -6,6 +6,7 @@ all original prompts and schemas.
 """
 
 import re
+from itertools import chain
 from typing import Dict, List, Any
 
 
@@ -18,6 +19,16 @@ MAX_RECAP_QUESTIONS = 5
 MAX_SECTIONS = 5
 QUESTION_OPTIONS_COUNT = 4
 
+# Schema descriptions that depend only on the constants above
+_CHECK_IN_OPTIONS_DESCRIPTION = f"An array containing exactly {QUESTION_OPTIONS_COUNT} possible answers."
+_RECAP_OPTIONS_DESCRIPTION = f"Exactly {QUESTION_OPTIONS_COUNT} possible answers"
+_RECAP_QUESTIONS_DESCRIPTION = (
+    f"0-{MAX_RECAP_QUESTIONS} recap questions for review and self-check, ordered from easy to moderate"
+)
+
+# Blank-line run separating markdown paragraphs
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
 
 # =============================================================================
 # SCHEMA BUILDERS - Reusable Schema Components
@@ -41,7 +52,7 @@ def build_check_in_question_schema() -> Dict[str, Any]:
                 "type": "array",
                 "items": {"type": "string"},
                 "minItems": QUESTION_OPTIONS_COUNT,
-                "description": f"An array containing exactly {QUESTION_OPTIONS_COUNT} possible answers."
+                "description": _CHECK_IN_OPTIONS_DESCRIPTION
             },
             "correct_answer": {
                 "type": "array",
@@ -112,7 +123,7 @@ def build_recap_questions_schema() -> Dict[str, Any]:
                     "items": {"type": "string"},
                     "minItems": QUESTION_OPTIONS_COUNT,
                     "maxItems": QUESTION_OPTIONS_COUNT,
-                    "description": f"Exactly {QUESTION_OPTIONS_COUNT} possible answers"
+                    "description": _RECAP_OPTIONS_DESCRIPTION
                 },
                 "correct_answers": {
                     "type": "array",
@@ -139,7 +150,7 @@ def build_recap_questions_schema() -> Dict[str, Any]:
         },
         "minItems": 0,
         "maxItems": MAX_RECAP_QUESTIONS,
-        "description": f"0-{MAX_RECAP_QUESTIONS} recap questions for review and self-check, ordered from easy to moderate"
+        "description": _RECAP_QUESTIONS_DESCRIPTION
     }
 
 
@@ -354,7 +365,7 @@ def prepare_title_list(index_helper: List[Dict[str, Any]]) -> List[str]:
     Returns:
         List of title strings with normalized quotes
     """
-    return [key.replace('"', "'") for d in index_helper for key in d.keys()]
+    return [key.replace('"', "'") for key in chain.from_iterable(index_helper)]
 
 
 def count_paragraphs(md_text: str) -> int:
@@ -367,7 +378,4 @@ def count_paragraphs(md_text: str) -> int:
     Returns:
         Number of paragraphs found
     """
-    md_text = md_text.strip()
-    blocks = re.split(r'\n\s*\n', md_text)
-    paragraphs = [b for b in blocks if b.strip()]
-    return len(paragraphs)
+    return sum(1 for b in _PARAGRAPH_SPLIT_RE.split(md_text.strip()) if b.strip())
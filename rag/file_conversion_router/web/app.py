@@ -14,6 +14,7 @@ Usage:
 
 import logging
 from contextlib import asynccontextmanager
+from typing import List, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -57,6 +58,7 @@ def create_app(
     title: str = "RAG Batch Upload API",
     version: str = "1.0.0",
     debug: bool = False,
+    cors_origins: Optional[List[str]] = None,
 ) -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -65,6 +67,9 @@ def create_app(
         title: API title for documentation
         version: API version
         debug: Enable debug mode
+        cors_origins: Origins allowed to call the API from a browser. None keeps
+            the permissive wildcard; an empty list skips the CORS middleware
+            entirely, for deployments only reached server-to-server
 
     Returns:
         Configured FastAPI application
@@ -78,13 +83,16 @@ def create_app(
     )
 
     # Configure CORS
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if cors_origins is None:
+        cors_origins = ["*"]  # Configure appropriately for production
+    if cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     # Import and include routers
     from file_conversion_router.web.router_batch import router as batch_router
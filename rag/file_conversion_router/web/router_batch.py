@@ -16,8 +16,8 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse, FileResponse, Response
 
 from file_conversion_router.config import (
     get_course_db_path,
@@ -43,6 +43,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# SSE comment frame sent while a job is idle
+_SSE_KEEPALIVE = b": keepalive\n\n"
+
 
 @router.post("/upload", response_model=BatchUploadResponse)
 async def upload_batch(
@@ -94,8 +97,19 @@ async def upload_batch(
             }
         )
 
-    # Filter to only valid files
-    valid_files = [f for f in files if f.filename in validation_result.valid_files]
+    # Filter to only valid files, describing each for the response as we go.
+    # Every FileInfo field is produced here, so skip validation.
+    valid_names = set(validation_result.valid_files)
+    valid_files = []
+    files_info = []
+    for f in files:
+        if f.filename in valid_names:
+            valid_files.append(f)
+            files_info.append(FileInfo.model_construct(
+                file_name=f.filename,
+                file_size=f.size or 0,
+                content_type=f.content_type,
+            ))
 
     # Create job. This path always has course context because it writes to DB.
     job_manager = get_job_manager()
@@ -150,16 +164,8 @@ async def upload_batch(
 
     background_tasks.add_task(run_batch_processing)
 
-    # Build response
-    files_info = []
-    for f in valid_files:
-        files_info.append(FileInfo(
-            file_name=f.filename,
-            file_size=f.size or 0,
-            content_type=f.content_type,
-        ))
-
-    return BatchUploadResponse(
+    # Build response; every field below is produced here, so skip validation
+    return BatchUploadResponse.model_construct(
         job_id=job_id,
         status=JobStatus.PENDING,
         files_received=len(valid_files),
@@ -170,7 +176,10 @@ async def upload_batch(
 
 
 @router.get("/{job_id}/stream")
-async def stream_progress(job_id: str):
+async def stream_progress(
+    job_id: str,
+    keepalive_seconds: float = Query(30.0, gt=0, le=300, description="Idle time before a keepalive comment is sent"),
+):
     """
     Stream real-time progress updates via Server-Sent Events (SSE).
 
@@ -183,7 +192,8 @@ async def stream_progress(job_id: str):
     - file_error: File failed with error
     - job_complete: All files processed
 
-    The connection will close automatically when the job completes.
+    The connection will close automatically when the job completes. Raise
+    keepalive_seconds when a proxy tolerates longer idle periods.
     """
     job_manager = get_job_manager()
 
@@ -203,18 +213,30 @@ async def stream_progress(job_id: str):
             while True:
                 try:
                     # Wait for next event with timeout for keepalive
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
-
-                    # Yield the event
-                    yield event.to_sse()
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive_seconds)
+
+                    # Drain whatever else is already queued so a burst of events
+                    # goes out in one write, stopping at job completion
+                    frames = [event.to_sse()]
+                    job_complete = event.event_type == ProgressEventType.JOB_COMPLETE
+                    while not job_complete:
+                        try:
+                            event = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        frames.append(event.to_sse())
+                        job_complete = event.event_type == ProgressEventType.JOB_COMPLETE
+
+                    # Yield the events
+                    yield b"".join(frames)
 
                     # Check if job is complete
-                    if event.event_type == ProgressEventType.JOB_COMPLETE:
+                    if job_complete:
                         break
 
                 except asyncio.TimeoutError:
                     # Send keepalive comment
-                    yield ": keepalive\n\n"
+                    yield _SSE_KEEPALIVE
 
                     # Check if job is still running
                     current_status = job_manager.get_job_status(job_id)
@@ -581,7 +603,10 @@ async def list_jobs(limit: int = 20):
     Returns the most recent jobs ordered by creation time.
     """
     job_manager = get_job_manager()
-    return job_manager.list_jobs(limit=limit)
+    return Response(
+        content=job_manager.list_jobs_json(limit=limit),
+        media_type="application/json",
+    )
 
 
 @router.delete("/{job_id}")
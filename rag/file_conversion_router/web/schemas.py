@@ -7,7 +7,8 @@ for request validation and response serialization.
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class JobStatus(str, Enum):
@@ -119,11 +120,6 @@ class BatchJobStatus(BaseModel):
     updated_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class BatchConversionResult(BaseModel):
     """Final result of a completed batch conversion."""
@@ -163,9 +159,15 @@ class ProgressEvent(BaseModel):
     # Completion fields
     result: Optional[BatchConversionResult] = None
 
-    def to_sse(self) -> str:
-        """Format as SSE event string."""
-        return f"event: {self.event_type.value}\ndata: {self.model_dump_json()}\n\n"
+    # Serialized frame, built on first use; events are not modified once pushed
+    _sse: Optional[bytes] = PrivateAttr(default=None)
+
+    def to_sse(self) -> bytes:
+        """Format as an SSE event frame, encoded as UTF-8."""
+        if self._sse is None:
+            payload = orjson.dumps(self.model_dump(mode="json"))
+            self._sse = b"event: %s\ndata: %s\n\n" % (self.event_type.value.encode(), payload)
+        return self._sse
 
 
 # ========================
@@ -1,8 +1,7 @@
-import requests
 from .driver import Driver, Resp
 from .requests_driver import RequestsDriver
-from bs4 import BeautifulSoup
-import re
+from bs4 import BeautifulSoup, SoupStrainer
+from scraper.Scraper_master.utils.file_utils import html_file_name
 from scraper.Scraper_master.utils.cache import get_cache
 
 
@@ -46,10 +45,9 @@ class CachedRequestsDriver(RequestsDriver):
             
             # Save file from cached content
             if "text/html" in content_type:
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = BeautifulSoup(content, 'lxml', parse_only=SoupStrainer('title'))
                 title = soup.title.string.strip() if soup.title and soup.title.string else None
-                filename = (re.sub(r'\s+', ' ', re.sub(r'[\\/:"*?<>|]+', ' ', title)).strip() + '.html' 
-                           if title else filename.rstrip('.html') + '.html')
+                filename = html_file_name(filename, title)
                 with open(filename, "w", encoding="utf-8") as file:
                     file.write(content)
             else:
@@ -63,7 +61,7 @@ class CachedRequestsDriver(RequestsDriver):
             )
         
         # Cache miss - make actual HTTP request
-        response = requests.get(url, stream=True)
+        response = self.session.get(url, stream=True, timeout=self._timeout)
         response.raise_for_status()
         
         content_type = response.headers.get("Content-Type", "").lower()
@@ -72,10 +70,9 @@ class CachedRequestsDriver(RequestsDriver):
         if "text/html" in content_type:
             content = response.text
             # Parse HTML and get the title
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml', parse_only=SoupStrainer('title'))
             title = soup.title.string.strip() if soup.title and soup.title.string else None
-            filename = (re.sub(r'\s+', ' ', re.sub(r'[\\/:"*?<>|]+', ' ', title)).strip() + '.html' 
-                       if title else filename.rstrip('.html') + '.html')
+            filename = html_file_name(filename, title)
             with open(filename, "w", encoding="utf-8") as file:
                 file.write(content)
         else:
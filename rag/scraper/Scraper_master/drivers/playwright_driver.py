@@ -1,17 +1,28 @@
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import re
 
 from .driver import Driver, Resp
+from scraper.Scraper_master.utils.file_utils import html_file_name
+
+# Image, font and media URLs, matched in the browser so other requests never reach Python.
+# Stylesheets and scripts are NOT blocked as they are often required for bot detection
+# challenges to resolve
+BLOCKED_RESOURCE_RE = re.compile(
+    r"\.(png|jpe?g|gif|webp|avif|bmp|ico|svg|woff2?|ttf|otf|eot|mp3|mp4|m4a|ogg|wav|webm|mov)(\?|$)",
+    re.IGNORECASE,
+)
 
 
 class PlaywrightDriver(Driver):
-    def __init__(self, headless=True, timeout=60000, max_retries=3, block_resources=True, requests_timeout=60, browser_type="chromium", skip_login_pages=True, cookies=None, bot_check_timeout=30000):
+    def __init__(self, headless=True, timeout=60000, max_retries=3, block_resources=True, requests_timeout=60, browser_type="chromium", skip_login_pages=True, cookies=None, bot_check_timeout=30000, javascript_enabled=True):
         self._play = None
         self._browser = None
         self._context = None
         self._page = None
+        self._requests_session = None
         self._headless = headless
         self._timeout = timeout  # Default 60 seconds for Playwright
         self._max_retries = max_retries
@@ -21,9 +32,17 @@ class PlaywrightDriver(Driver):
         self._skip_login_pages = skip_login_pages
         self._cookies = cookies  # Optional cookies for authenticated sessions
         self._bot_check_timeout = bot_check_timeout  # Max ms to wait for bot challenges to resolve
+        self._javascript_enabled = javascript_enabled  # Disable for static sites to skip JS and dynamic-content waits
         self._initialize_browser()
 
     def _initialize_browser(self):
+        # Shared session for the direct-download fallback so retries and later
+        # binary files reuse open connections instead of new TLS handshakes
+        self._requests_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._requests_session.mount("http://", adapter)
+        self._requests_session.mount("https://", adapter)
+
         self._play = sync_playwright().start()
 
         # Browser launch args to fix HTTP/2 and bot detection issues
@@ -53,6 +72,7 @@ class PlaywrightDriver(Driver):
         # Create context with realistic user agent
         self._context = self._browser.new_context(
             accept_downloads=True,
+            java_script_enabled=self._javascript_enabled,
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
 
@@ -60,22 +80,26 @@ class PlaywrightDriver(Driver):
         if self._cookies:
             self._context.add_cookies(self._cookies)
 
+        # Block unnecessary resources to speed up page loading (optional).
+        # Playwright tries the most recently registered route first, so URLs with a
+        # known extension are aborted by the pattern route; extension-less ones
+        # (image CDNs, font APIs) fall through to the resource-type check.
+        if self._block_resources_enabled:
+            self._context.route("**/*", self._block_by_resource_type)
+            self._context.route(BLOCKED_RESOURCE_RE, self._block_resources)
+
         self._page = self._context.new_page()
 
         # Set default timeout for all operations
         self._page.set_default_timeout(self._timeout)
 
-        # Block unnecessary resources to speed up page loading (optional)
-        if self._block_resources_enabled:
-            self._page.route("**/*", self._block_resources)
-
     def _block_resources(self, route):
-        """Block unnecessary resources to speed up page loading"""
-        resource_type = route.request.resource_type
-        # Block images, fonts, and media to speed up loading
-        # Note: stylesheets and scripts are NOT blocked as they are often
-        # required for bot detection challenges to resolve
-        if resource_type in ["image", "font", "media"]:
+        """Abort image, font and media requests matched by BLOCKED_RESOURCE_RE"""
+        route.abort()
+
+    def _block_by_resource_type(self, route):
+        """Abort image, font and media requests whose URL the pattern missed"""
+        if route.request.resource_type in ("image", "font", "media"):
             route.abort()
         else:
             route.continue_()
@@ -119,54 +143,63 @@ class PlaywrightDriver(Driver):
                 return
         print(f"Bot challenge did not resolve within {self._bot_check_timeout}ms")
 
+    # Login detection indicators, checked against lowercased URLs and page content
+    LOGIN_URL_PATTERNS = ("/login", "/signin", "/sign-in", "/auth", "/register")
+    LOGIN_KEYWORDS = (
+        "please login",
+        "please sign in",
+        "sign in to continue",
+        "login to access",
+        "authentication required",
+        "you must be logged in",
+        "create an account",
+        "member login",
+        "access denied",
+        "subscription required",
+    )
+    # Password fields with any attribute quoting (type="password", type='password',
+    # type=password) and login form class or id names
+    LOGIN_FORM_RE = re.compile(
+        r"""(?<![\w-])(?:type|name|id)\s*=\s*["']?password["'\s/>]|(?:login|signin|auth)-form"""
+    )
+    LOGIN_WORDS = ("login", "sign in", "sign-in")
+
     def _requires_login(self, url, html_content):
         """
         Detect if a page requires login/authentication.
         Checks for common login indicators in the URL and page content.
         """
         url_lower = url.lower()
-        content_lower = html_content.lower() if html_content else ""
 
         # Check URL patterns
-        login_url_patterns = ["/login", "/signin", "/sign-in", "/auth", "/register"]
-        if any(pattern in url_lower for pattern in login_url_patterns):
+        if any(pattern in url_lower for pattern in self.LOGIN_URL_PATTERNS):
             return True
 
-        # Check for common login-related keywords in content
-        login_keywords = [
-            "please login",
-            "please sign in",
-            "sign in to continue",
-            "login to access",
-            "authentication required",
-            "you must be logged in",
-            "create an account",
-            "member login",
-            "access denied",
-            "subscription required",
-        ]
+        content_lower = html_content.lower() if html_content else ""
 
-        # Check if multiple keywords appear
-        keyword_count = sum(1 for keyword in login_keywords if keyword in content_lower)
-        if keyword_count >= 2:
-            return True
+        # Check if multiple keywords appear, stopping as soon as two are found
+        keyword_count = 0
+        for keyword in self.LOGIN_KEYWORDS:
+            if keyword in content_lower:
+                keyword_count += 1
+                if keyword_count >= 2:
+                    return True
 
         # Check for login form indicators
-        login_form_indicators = [
-            'type="password"',
-            'name="password"',
-            'id="password"',
-            "login-form",
-            "signin-form",
-            "auth-form",
-        ]
-        if any(indicator in content_lower for indicator in login_form_indicators):
+        if self._has_login_form(content_lower):
             # Additional check: make sure there's actual content requiring login
-            if any(keyword in content_lower for keyword in ["login", "sign in", "sign-in"]):
+            if any(keyword in content_lower for keyword in self.LOGIN_WORDS):
                 return True
 
         return False
 
+    def _has_login_form(self, content_lower):
+        """
+        Check the lowercased page HTML for login form elements.
+        Works on the content already fetched, so no extra round-trip to the browser.
+        """
+        return self.LOGIN_FORM_RE.search(content_lower) is not None
+
     def download_raw(self, filename: str, url: str) -> tuple[str, Resp]:
         """
         Attempt to download the content as HTML first, and fallback to binary if an error occurs.
@@ -198,18 +231,21 @@ class PlaywrightDriver(Driver):
                     except PlaywrightTimeoutError:
                         pass  # Some pages never fully "load" -- proceed with what we have
 
-                    # Wait for network to settle — catches JS-initiated navigations/redirects
-                    # that fire after the initial "load" event (e.g. wiki.ros.org double-nav)
-                    try:
-                        self._page.wait_for_load_state("networkidle", timeout=self._timeout)
-                    except PlaywrightTimeoutError:
-                        pass  # Some pages never reach networkidle -- proceed with what we have
+                    # Without JS there are no late navigations, dynamic content or
+                    # bot challenges to wait for, so the page is final after "load"
+                    if self._javascript_enabled:
+                        # Wait for network to settle — catches JS-initiated navigations/redirects
+                        # that fire after the initial "load" event (e.g. wiki.ros.org double-nav)
+                        try:
+                            self._page.wait_for_load_state("networkidle", timeout=self._timeout)
+                        except PlaywrightTimeoutError:
+                            pass  # Some pages never reach networkidle -- proceed with what we have
 
-                    # Brief additional wait for late-firing dynamic content
-                    self._page.wait_for_timeout(1000)
+                        # Brief additional wait for late-firing dynamic content
+                        self._page.wait_for_timeout(1000)
 
-                    # Detect and wait for bot detection challenges to resolve
-                    self._wait_for_bot_challenge()
+                        # Detect and wait for bot detection challenges to resolve
+                        self._wait_for_bot_challenge()
 
                     try:
                         html_content = self._page.content()
@@ -224,14 +260,7 @@ class PlaywrightDriver(Driver):
                         raise Exception(f"LOGIN_REQUIRED: {url} requires authentication")
 
                     # Get page title safely and sanitize for filename
-                    title = self._safe_title()
-                    if title:
-                        title = title.strip()
-                        # Sanitize title: remove invalid filename characters
-                        sanitized_title = re.sub(r'\s+', ' ', re.sub(r'[\\/:"*?<>|]+', ' ', title)).strip()
-                        filename = sanitized_title + '.html' if sanitized_title else filename.rstrip('.html') + '.html'
-                    else:
-                        filename = filename.rstrip('.html') + '.html'
+                    filename = html_file_name(filename, self._safe_title())
 
                     with open(filename, "w", encoding="utf-8") as f:
                         f.write(html_content)
@@ -259,7 +288,7 @@ class PlaywrightDriver(Driver):
                 # For non-HTML content or other errors, try downloading as binary
                 print(f"Playwright failed ({e}), trying direct download...")
                 try:
-                    response = requests.get(url, stream=True, timeout=self._requests_timeout)
+                    response = self._requests_session.get(url, stream=True, timeout=self._requests_timeout)
                     response.raise_for_status()
 
                     with open(filename, "wb") as file:
@@ -288,3 +317,5 @@ class PlaywrightDriver(Driver):
             self._browser.close()
         if self._play:
             self._play.stop()
+        if self._requests_session:
+            self._requests_session.close()
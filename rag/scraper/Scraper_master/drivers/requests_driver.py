@@ -1,9 +1,10 @@
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import random
 from .driver import Driver, Resp
-from bs4 import BeautifulSoup
-import re
+from bs4 import BeautifulSoup, SoupStrainer
+from scraper.Scraper_master.utils.file_utils import html_file_name
 
 
 class RequestsDriver(Driver):
@@ -11,6 +12,10 @@ class RequestsDriver(Driver):
         self._timeout = timeout
         self._max_retries = max_retries
         self.session = requests.Session()
+        # Keep connections to the crawled hosts alive across pages
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         # Set modern browser headers to avoid bot detection
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -46,17 +51,13 @@ class RequestsDriver(Driver):
 
         if "text/html" in content_type:
             # Parse HTML and get the title safely
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml', parse_only=SoupStrainer('title'))
             title = None
             if soup.title and soup.title.string:
                 title = soup.title.string.strip()
 
             # Sanitize title for filename, fallback to original filename if no title
-            if title:
-                sanitized_title = re.sub(r'\s+', ' ', re.sub(r'[\\/:"*?<>|]+', ' ', title)).strip()
-                filename = sanitized_title + '.html' if sanitized_title else filename.rstrip('.html') + '.html'
-            else:
-                filename = filename.rstrip('.html') + '.html'
+            filename = html_file_name(filename, title)
 
             with open(filename, "w", encoding="utf-8") as file:
                 file.write(response.text)
@@ -5,10 +5,10 @@ from scraper.Scraper_master.utils.web_utils import *
 
 class GeneralScraper(BaseScraper):
     def scrape(self, url, driver, task_folder_path):
-        create_and_enter_dir(
-            os.path.join(task_folder_path, urlparse(url).path.lstrip("/").rsplit("/", 1)[0])
-        )
-        filename = get_file_name(url)
+        # Write under an absolute directory instead of chdir'ing into it for every page
+        target_dir = os.path.join(task_folder_path, urlparse(url).path.lstrip("/").rsplit("/", 1)[0])
+        os.makedirs(target_dir, exist_ok=True)
+        filename = os.path.join(target_dir, get_file_name(url))
         filename,resp = driver.download_raw(filename, url)
         self._save_metadata(filename, url)
         links = []
@@ -19,6 +19,8 @@ class ScrapeMd(BaseScraper):
         self.url = scrape_url
         self.site_url = site_url
         self.root_filename = root_filename
+        # One session for all GitHub fetches so the crawl reuses its connection
+        self.session = requests.Session()
 
     def get_content(self, url):
         """
@@ -28,7 +30,7 @@ class ScrapeMd(BaseScraper):
         """
         # Fetch the content from the URL
         headers = {"Accept": "application/json"}
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         data = response.json()
         content = data["payload"]["blob"]["rawLines"]
 
@@ -43,7 +45,7 @@ class ScrapeMd(BaseScraper):
         - url (str): The GitHub URL from which the file content is to be fetched.
         - Returns: The decoded content of the file.
         """
-        response = requests.get(url)
+        response = self.session.get(url)
         data = response.json()
         content = base64.b64decode(data["content"]).decode("utf-8")
         return content
@@ -55,7 +57,7 @@ class ScrapeMd(BaseScraper):
         - Returns: A list of markdown file names.
         """
         headers = {"Accept": "application/json"}
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         data = response.json()
         childs = []
         md_files = data["payload"]["tree"]["items"]
@@ -158,7 +160,7 @@ class ScrapeMd(BaseScraper):
         headers = {"Accept": "application/json"}
 
         # Send the GET request
-        response = requests.get(self.url, headers=headers)
+        response = self.session.get(self.url, headers=headers)
 
         # Load the JSON data returned by the server
         data = response.json()
@@ -13,12 +13,16 @@ from scraper.Scraper_master.utils.file_utils import (
 
 ignore = ["glossary", "*"]
 
+TOCTREE_LINK_RE = re.compile(r"<(.*?)>")
+
 
 class ScrapeRst(BaseScraper):
     def __init__(self, github_url, doc_url, filename):
         self.url = github_url
         self.filename = filename
         self.doc_url = doc_url
+        # One session for all GitHub fetches so the crawl reuses its connection
+        self.session = requests.Session()
 
     def get_content(self, url):
         """
@@ -30,7 +34,7 @@ class ScrapeRst(BaseScraper):
         # print(f"Fetching data from {url}")
         headers = {"Accept": "application/json"}
         try:
-            response = requests.get(url + "?plain=1", headers=headers)
+            response = self.session.get(url + "?plain=1", headers=headers)
             response.raise_for_status()
             data = response.json()
 
@@ -42,17 +46,19 @@ class ScrapeRst(BaseScraper):
             print(f"Failed to fetch data from {url}: {e}")
             return None
 
-    def extract_toctree_from_rst(self, url):
+    def extract_toctree_from_rst(self, url, content=None):
         """
         Extracts the table of contents tree (toctree) from a reStructuredText (.rst) file.
 
         Args:
             url (str): The URL of the .rst file to parse.
+            content (str, optional): The already fetched file content, to avoid fetching it again.
 
         Returns:
             list: A list containing the extracted toctree links.
         """
-        content = self.get_content(url)
+        if content is None:
+            content = self.get_content(url)
         if content is None:
             return []
 
@@ -67,7 +73,7 @@ class ScrapeRst(BaseScraper):
 
                 cur += 1
                 while cur < len(lines) and lines[cur].strip() != "":
-                    match = re.search(r"<(.*?)>", lines[cur])
+                    match = TOCTREE_LINK_RE.search(lines[cur])
                     if match:
                         toctree_content.append(match.group(1).strip())
                     else:
@@ -90,9 +96,9 @@ class ScrapeRst(BaseScraper):
             return
 
         filename = f"{cur_file}"
-        self.content_extract(filename, url)
+        self.content_extract(filename, url, content=content)
         self.metadata_extract(filename, url)
-        toctree_content = self.extract_toctree_from_rst(url)
+        toctree_content = self.extract_toctree_from_rst(url, content=content)
         url = cd_back_link(url) + "/"
         current_directory = os.getcwd()
 
@@ -101,7 +107,7 @@ class ScrapeRst(BaseScraper):
                 sublink = sublink[1:]
                 part = sublink.split("/")
                 cur_name, dir = part[-1], "/".join(part[:-1])
-                if cur_name == "*" or re.match(r"^https.*", sublink) is not None:
+                if cur_name == "*" or sublink.startswith("https"):
                     continue
                 os.chdir(home_dir)
                 create_and_enter_dir(dir)
@@ -114,7 +120,7 @@ class ScrapeRst(BaseScraper):
             else:
                 part = sublink.split("/")
                 cur_name, dir = part[-1], "/".join(part[:-1])
-                if cur_name in ignore or re.match(r"^https.*", sublink) is not None:
+                if cur_name in ignore or sublink.startswith("https"):
                     continue
                 create_and_enter_dir(dir)
                 sublink = sublink[:-4] if sublink.endswith(".rst") else sublink
@@ -129,13 +135,15 @@ class ScrapeRst(BaseScraper):
         home_dir = os.getcwd()
         self.tree_call("index", self.url, home_url, home_dir)
 
-    def content_extract(self, filename, url, **kwargs):
+    def content_extract(self, filename, url, content=None, **kwargs):
         """
         Extracts content from a given URL and saves it to a file.
         - filename (str): The name of the file to save the content to.
         - url (str): The URL to fetch the content from.
+        - content (str, optional): The already fetched content, to avoid fetching it again.
         """
-        content = self.get_content(url)
+        if content is None:
+            content = self.get_content(url)
         if content:
             save_to_file(f"{filename}.rst", content)
 
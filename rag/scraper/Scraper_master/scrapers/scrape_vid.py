@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import parse_qs, urlparse
 
 import requests
@@ -9,6 +10,9 @@ from bs4 import BeautifulSoup
 from scraper.Scraper_master.scrapers.base_scraper import BaseScraper
 from scraper.Scraper_master.utils.file_utils import *
 
+PLAYLIST_METADATA_WORKERS = 16
+DOWNLOAD_ARCHIVE_NAME = ".yt_dlp_archive"
+
 
 class VideoScraper(BaseScraper):
     def scrape(self, url, driver, task_folder_path):
@@ -65,6 +69,9 @@ class VideoScraper(BaseScraper):
             # "cookiefile": "/home/bot/bot/yk/YK_final/www.youtube.com_cookies.txt",
             "cookiesfrombrowser": ('chrome', ),
             "outtmpl": outtmpl,
+            # Videos recorded here on earlier runs are skipped before yt-dlp
+            # fetches their full info
+            "download_archive": os.path.join(folder, DOWNLOAD_ARCHIVE_NAME),
             "ignoreerrors": True,
 
             # Network retry settings for HTTP 500 and connection errors
@@ -89,25 +96,25 @@ class VideoScraper(BaseScraper):
             return
         if video_info.get('_type') == 'playlist':
             playlist_url = video_info.get('webpage_url')
+            metadata_items = []
             for entry in video_info['entries']:
+                # Failed entries are None, and archived entries have no download
+                if not entry or not entry.get('requested_downloads'):
+                    continue
                 video_url = entry.get('original_url', entry.get('url'))
-                playlist_index = entry.get('playlist_index')
                 filepath = f"{entry['requested_downloads'][0]['filepath']}"
-
-                # Construct video-in-playlist URL
-                video_in_playlist_url = None
-                if playlist_url and playlist_index:
-                    # Extract playlist ID from playlist_url
-                    parsed_playlist = urlparse(playlist_url)
-                    playlist_params = parse_qs(parsed_playlist.query)
-
-                # Save metadata with all URLs
                 additional_metadata = {
                     'playlist_url': playlist_url,
                 }
-                self._save_metadata(filepath, video_url, additional_metadata)
+                metadata_items.append((filepath, video_url, additional_metadata))
+
+            # Each entry writes its own small YAML file; overlap the file I/O
+            with ThreadPoolExecutor(max_workers=PLAYLIST_METADATA_WORKERS) as pool:
+                list(pool.map(lambda item: self._save_metadata(*item), metadata_items))
         else:
             # For single video
+            if not video_info.get('requested_downloads'):
+                return
             video_url = video_info.get('original_url', video_info.get('url'))
             filepath = f"{video_info['requested_downloads'][0]['filepath']}"
             self._save_metadata(filepath, video_url)
@@ -149,58 +149,60 @@ class WebScraper:
     #                 # self.current_depths[link_root] -= 1
 
     def dfs_crawl(self, url, visited, root_configs, driver):
-        """Recursively crawl URLs using DFS approach"""
-        # Skip if already visited
-        if url in visited:
-            return
-
-        # Determine which root this URL belongs to
-        matching_root = None
-        for root_url in root_configs:
-            if url.startswith(root_url) or url == root_url:
-                matching_root = root_url
-                break
-
-        # If no matching root and not the starting URL, skip
-        if not matching_root:
+        """Crawl URLs depth-first, using an explicit stack instead of recursion"""
+        # Each entry carries the per-root depths along its own path
+        stack = [(url, dict(self.current_depths))]
+        while stack:
+            url, depths = stack.pop()
+            # Skip if already visited
+            if url in visited:
+                continue
+
+            # Determine which root this URL belongs to
+            matching_root = None
+            for root_url in root_configs:
+                if url.startswith(root_url) or url == root_url:
+                    matching_root = root_url
+                    break
+
+            # If no matching root and not the starting URL, skip
+            if not matching_root:
+                visited.add(url)
+                continue
+
+            root_config = root_configs[matching_root]
+            max_depth = root_config["depth"]
+            scraper_type = root_config["scraper_type"]
+            subtask_folder_path = root_config.get("subtask_folder_path", None)
+            target_folder = self.task_folder_path / subtask_folder_path if subtask_folder_path else self.task_folder_path
+            # Skip if we've reached max depth for this root
+            if depths[matching_root] >= max_depth:
+                continue
             visited.add(url)
-            return
-
-        root_config = root_configs[matching_root]
-        max_depth = root_config["depth"]
-        scraper_type = root_config["scraper_type"]
-        subtask_folder_path = root_config.get("subtask_folder_path", None)
-        target_folder = self.task_folder_path / subtask_folder_path if subtask_folder_path else self.task_folder_path
-        # Skip if we've reached max depth for this root
-        if self.current_depths[matching_root] >= max_depth:
-            return
-        visited.add(url)
-
-        indent = "         " * self.current_depths[matching_root]
-
-        # Get appropriate scraper
-        if scraper_type not in SCRAPER_MAPPING:
-            raise ValueError(f"Unknown scraper type: {scraper_type}")
-        scraper = SCRAPER_MAPPING.get(scraper_type)()
-
-        self.logger.info(f"")
-        self.logger.info(f"{indent}Processing: {url}")
-        self.logger.info(
-            f"{indent}(depth: {self.current_depths[matching_root]}, root: {matching_root})"
-        )
-        # Scrape the page
-        try:
-            links = scraper.scrape(url, driver, target_folder)
-        except Exception as e:
-            self.logger.error(f"{indent}Error processing link {url}: {e}")
-            return
-
-        # Process each link with DFS
-        for link in links:
-            self.current_depths[matching_root] += 1
-            self.dfs_crawl(link, visited, root_configs, driver)
-            self.current_depths[matching_root] -= 1
 
+            indent = "         " * depths[matching_root]
+
+            # Get appropriate scraper
+            if scraper_type not in SCRAPER_MAPPING:
+                raise ValueError(f"Unknown scraper type: {scraper_type}")
+            scraper = SCRAPER_MAPPING.get(scraper_type)()
+
+            self.logger.info(f"")
+            self.logger.info(f"{indent}Processing: {url}")
+            self.logger.info(
+                f"{indent}(depth: {depths[matching_root]}, root: {matching_root})"
+            )
+            # Scrape the page
+            try:
+                links = scraper.scrape(url, driver, target_folder)
+            except Exception as e:
+                self.logger.error(f"{indent}Error processing link {url}: {e}")
+                continue
+
+            # Push links in reverse so they are visited in page order
+            child_depths = {**depths, matching_root: depths[matching_root] + 1}
+            for link in reversed(list(links)):
+                stack.append((link, child_depths))
 
 
 if __name__ == "__main__":
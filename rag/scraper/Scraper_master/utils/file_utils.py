@@ -2,6 +2,10 @@ import os
 import re
 import shutil
 
+_EMPTY_LINES_RE = re.compile(r"\n\s*\n")
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[\\/:"*?<>|]+')
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def create_and_enter_dir(directory_name):
     """
@@ -49,7 +53,37 @@ def remove_consecutive_empty_lines(text):
     Returns:
     - str: Cleaned text with single empty lines.
     """
-    return re.sub(r"\n\s*\n", "\n\n", text)
+    return _EMPTY_LINES_RE.sub("\n\n", text)
+
+
+def sanitize_title(title):
+    """
+    Turns a page title into a string that is safe to use as a file name.
+
+    Parameters:
+    - title (str): The page title.
+
+    Returns:
+    - str: The title with invalid file name characters and runs of whitespace collapsed to single spaces.
+    """
+    return _WHITESPACE_RE.sub(" ", _INVALID_FILENAME_CHARS_RE.sub(" ", title)).strip()
+
+
+def html_file_name(filename, title):
+    """
+    Picks the file name for a downloaded HTML page, kept in the directory of the requested file name.
+
+    Parameters:
+    - filename (str): The requested file path for the page.
+    - title (str): The page title, or None if the page has none.
+
+    Returns:
+    - str: The sanitized title with an .html extension, or the requested name with .html if the title is empty.
+    """
+    directory, name = os.path.split(filename)
+    sanitized_title = sanitize_title(title) if title else ""
+    name = sanitized_title + ".html" if sanitized_title else name.rstrip(".html") + ".html"
+    return os.path.join(directory, name)
 
 
 def save_to_file(file_name, content):
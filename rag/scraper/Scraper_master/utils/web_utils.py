@@ -1,9 +1,15 @@
 import os
+from functools import lru_cache
 import urllib.robotparser as robotparser
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from urllib.parse import urlparse, urlunparse, urljoin, unquote
 
 
+# Parse link-extraction input as UTF-8 bytes so pages with an XML encoding
+# declaration are accepted
+_LINK_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
 def remove_slash_and_hash(link):
     """
     Removes trailing slash (if present) and hash fragment from a given URL.
@@ -24,9 +30,11 @@ def remove_slash_and_hash(link):
     return link
 
 
+@lru_cache(maxsize=None)
 def get_crawl_delay(site_url, user_agent="*"):
     """
     Fetches the crawl delay from the robots.txt file of the given website.
+    Results are cached per site, so robots.txt is fetched once per process.
 
     Parameters:
     - site_url (str): The base URL of the website.
@@ -89,6 +97,15 @@ def join_url(root_url: str, href: str) -> str:
       unless they are just anchors or empty.
     - If href is empty or None, returns the normalized root_url.
     """
+    _validate_root_url(root_url)
+    return _join_href(root_url, href)
+
+
+# Hrefs that do not point to another page and resolve to the root URL
+_NON_PAGE_HREF_PREFIXES = ("#", "javascript:", "mailto:", "tel:", "data:")
+
+
+def _validate_root_url(root_url: str) -> None:
     if not root_url:
         raise ValueError("root_url must be a non-empty absolute URL.")
 
@@ -98,19 +115,19 @@ def join_url(root_url: str, href: str) -> str:
             "root_url must be a valid absolute URL (with scheme and netloc)."
         )
 
+
+def _join_href(root_url: str, href: str) -> str:
+    """join_url without re-validating root_url, for use inside link loops."""
     # Handle empty or None href
     if (
         not href
         or href.isspace()
-        or href.lower().startswith(("#", "javascript:", "mailto:", "tel:", "data:"))
+        or href.lower().startswith(_NON_PAGE_HREF_PREFIXES)
     ):
         return root_url
 
     # Use urljoin for general case: relative or absolute URLs
-    joined = urljoin(root_url, href)
-
-    # Normalize the result
-    return joined
+    return urljoin(root_url, href)
 
 
 def extract_unique_links(true_url, html):
@@ -122,10 +139,20 @@ def extract_unique_links(true_url, html):
     - set: A set of unique links found in the response.
     """
     unique_links = set()
-    soup = BeautifulSoup(html, "html.parser")
-    for link in soup.find_all("a"):
-        href = link.get("href")
-        link = join_url(true_url, href)
+    try:
+        tree = lxml_html.document_fromstring(
+            html.encode("utf-8", "replace"), parser=_LINK_HTML_PARSER
+        )
+    except etree.ParserError:  # empty document
+        return unique_links
+    # Read hrefs straight off the lxml elements, without per-anchor wrapper objects.
+    # Pages repeat the same hrefs (nav bars, footers), so resolve each one once
+    hrefs = {anchor.get("href") for anchor in tree.iter("a")}
+    if hrefs:
+        # The base URL is the same for every anchor, so check it once
+        _validate_root_url(true_url)
+    # Different hrefs often join to the same URL; normalize each URL once
+    for link in {_join_href(true_url, href) for href in hrefs}:
         if "www.youtube.com" not in link:
             link = normalize_url(link)
         unique_links.add(link)
@@ -0,0 +1,47 @@
+"""Tests for where GeneralScraper writes crawled pages."""
+
+import os
+
+from scraper.Scraper_master.drivers.driver import Driver, Resp
+from scraper.Scraper_master.scrapers.general_scraper import GeneralScraper
+
+
+class _RecordingDriver(Driver):
+    """Driver that writes a fixed page and records the paths it was given."""
+
+    def __init__(self):
+        self.filenames = []
+
+    def download_raw(self, filename, url):
+        self.filenames.append(filename)
+        with open(filename, "w") as f:
+            f.write("<html></html>")
+        return filename, Resp(html_content="<html></html>", is_html=False, true_url=url)
+
+    def close(self):
+        pass
+
+
+def test_scrape_writes_under_task_folder_without_chdir(tmp_path, monkeypatch):
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    task_folder = tmp_path / "task"
+    driver = _RecordingDriver()
+
+    GeneralScraper().scrape("https://example.com/docs/guide/page.html", driver, str(task_folder))
+
+    page = task_folder / "docs" / "guide" / "page.html"
+    assert driver.filenames == [str(page)]
+    assert page.read_text() == "<html></html>"
+    assert (task_folder / "docs" / "guide" / "page.html_metadata.yaml").read_text().startswith(
+        "URL: https://example.com/docs/guide/page.html"
+    )
+    assert os.getcwd() == str(elsewhere)
+    assert list(elsewhere.iterdir()) == []
+
+
+def test_scrape_root_url(tmp_path):
+    driver = _RecordingDriver()
+    GeneralScraper().scrape("https://example.com/", driver, str(tmp_path))
+    assert driver.filenames == [os.path.join(str(tmp_path), "root")]
@@ -0,0 +1,55 @@
+"""Tests for copying uploaded files in temp_storage_service."""
+
+import io
+import os
+from tempfile import SpooledTemporaryFile
+
+import pytest
+
+from file_conversion_router.services import temp_storage_service
+from file_conversion_router.services.temp_storage_service import _copy_upload
+
+PAYLOAD = os.urandom(256 * 1024) + b"tail"
+
+
+def _spooled(max_size: int) -> SpooledTemporaryFile:
+    source = SpooledTemporaryFile(max_size=max_size)
+    source.write(PAYLOAD)
+    return source
+
+
+@pytest.mark.parametrize(
+    "max_size",
+    [len(PAYLOAD) * 2, 1024],
+    ids=["in-memory", "rolled-to-disk"],
+)
+def test_copy_upload_spooled_file(tmp_path, max_size):
+    destination = tmp_path / "upload.bin"
+    with _spooled(max_size) as source:
+        assert _copy_upload(source, destination) == len(PAYLOAD)
+    assert destination.read_bytes() == PAYLOAD
+
+
+def test_copy_upload_without_file_descriptor(tmp_path):
+    destination = tmp_path / "upload.bin"
+    assert _copy_upload(io.BytesIO(PAYLOAD), destination) == len(PAYLOAD)
+    assert destination.read_bytes() == PAYLOAD
+
+
+def test_copy_upload_falls_back_when_sendfile_fails(tmp_path, monkeypatch):
+    def failing_sendfile(*args):
+        raise OSError("sendfile not supported")
+
+    monkeypatch.setattr(temp_storage_service.os, "sendfile", failing_sendfile, raising=False)
+    destination = tmp_path / "upload.bin"
+    with _spooled(1024) as source:
+        assert _copy_upload(source, destination) == len(PAYLOAD)
+    assert destination.read_bytes() == PAYLOAD
+
+
+def test_copy_upload_rewinds_source(tmp_path):
+    destination = tmp_path / "upload.bin"
+    with _spooled(1024) as source:
+        source.seek(10)
+        _copy_upload(source, destination)
+    assert destination.read_bytes() == PAYLOAD
@@ -0,0 +1,187 @@
+"""Tests for transcript title insertion and processing in title_handle."""
+
+import json
+
+import pytest
+
+from loguru import logger
+
+from file_conversion_router.utils.title_handle import (
+    ProcessingConfig,
+    SchemaFactory,
+    SpeakerProcessor,
+    TranscriptManager,
+    _check_response,
+    find_insertion_position,
+    process_transcript,
+)
+
+
+def _entry(start, text="hello"):
+    return {"start time": start, "end time": start, "speaker": "Speaker_00", "text content": text}
+
+
+def _titles(result):
+    """Return (index, title) for every title entry in a processed transcript."""
+    return [
+        (i, entry["text content"])
+        for i, entry in enumerate(result)
+        if entry.get("speaker", "").startswith("title-")
+    ]
+
+
+@pytest.fixture()
+def manager():
+    return TranscriptManager()
+
+
+def test_insert_titles_orders_by_start_time(manager):
+    transcript = [_entry(0.0), _entry(5.0), _entry(10.0)]
+    index_helper = {("Intro", "Details"): ["6.0"], ("Intro",): ["0.0"]}
+
+    result = manager._insert_titles(transcript, index_helper)
+
+    assert _titles(result) == [(0, "Intro"), (3, "Details")]
+    assert result[3] == {
+        "start time": 6.0,
+        "end time": 6.0,
+        "speaker": "title-2",
+        "text content": "Details",
+    }
+
+
+def test_insert_titles_after_last_entry(manager):
+    result = manager._insert_titles([_entry(0.0)], {("End",): ["99.0"]})
+    assert _titles(result) == [(1, "End")]
+
+
+def test_insert_titles_into_empty_transcript(manager):
+    result = manager._insert_titles([], {("Intro",): ["0.0"]})
+    assert _titles(result) == [(0, "Intro")]
+
+
+def test_insert_titles_unsorted_transcript(manager):
+    # A title goes before the first entry starting at or after it
+    transcript = [_entry(0.0), _entry(8.0), _entry(3.0), _entry(9.0)]
+    result = manager._insert_titles(transcript, {("T",): ["5.0"]})
+    assert _titles(result) == [(1, "T")]
+
+
+@pytest.mark.parametrize("bad_start", [None, "garbage", {}, []])
+def test_insert_titles_skips_invalid_start_times(manager, bad_start):
+    transcript = [_entry(0.0), _entry(5.0), _entry(bad_start), _entry(7.0)]
+
+    result = manager._insert_titles(transcript, {("Intro",): ["0.0"], ("Later",): ["6.0"]})
+
+    assert _titles(result) == [(0, "Intro"), (4, "Later")]
+    assert result[3]["start time"] == bad_start
+
+
+def test_insert_titles_trailing_null_start_time(manager):
+    transcript = [_entry(0.0), _entry(5.0), _entry(None)]
+    result = manager._insert_titles(transcript, {("Intro",): ["0.0"], ("End",): ["9.0"]})
+    assert _titles(result) == [(0, "Intro"), (4, "End")]
+
+
+def test_insert_titles_missing_start_time(manager):
+    transcript = [_entry(0.0), {"speaker": "Speaker_00", "text content": "no time"}, _entry(4.0)]
+    result = manager._insert_titles(transcript, {("T",): ["2.0"]})
+    assert _titles(result) == [(2, "T")]
+
+
+def test_find_insertion_position_matches_insert_titles(manager):
+    transcript = [_entry(0.0), _entry(None), _entry("garbage"), _entry(5.0), _entry(2.0)]
+    for target in ("-1.0", "0.0", "3.0", "5.0", "6.0"):
+        result = manager._insert_titles(transcript, {("T",): [target]})
+        assert _titles(result) == [(find_insertion_position(transcript, target), "T")]
+
+
+def test_process_transcript_with_null_timestamps(tmp_path):
+    json_path = tmp_path / "lecture.json"
+    transcript = [_entry(0.0), _entry(5.0), _entry(None)]
+    json_path.write_text(json.dumps(transcript), encoding="utf-8")
+
+    process_transcript(str(json_path), index_helper={("Intro",): ["0.0"]}, group=False)
+
+    result = json.loads(json_path.read_text(encoding="utf-8"))
+    assert _titles(result) == [(0, "Intro")]
+    assert result[1:] == transcript
+
+
+def test_process_transcript_leaves_unreadable_file(tmp_path):
+    json_path = tmp_path / "broken.json"
+    json_path.write_text("{not json", encoding="utf-8")
+
+    assert process_transcript(str(json_path), index_helper={("Intro",): ["0.0"]}) == str(json_path)
+    assert json_path.read_text(encoding="utf-8") == "{not json"
+
+
+def test_process_transcript_groups_without_titles_on_bad_index_helper(tmp_path):
+    json_path = tmp_path / "lecture.json"
+    json_path.write_text(json.dumps([_entry(0.0, "one"), _entry(1.0, "two")]), encoding="utf-8")
+
+    process_transcript(str(json_path), index_helper={("Intro",): ["not a time"]})
+
+    result = json.loads(json_path.read_text(encoding="utf-8"))
+    assert [entry["text content"] for entry in result] == ["one two"]
+
+
+@pytest.mark.parametrize("pretty_json", [True, False])
+def test_update_speakers_in_json_honours_pretty_json(tmp_path, pretty_json):
+    json_path = tmp_path / "lecture.json"
+    transcript = [_entry(0.0), _entry(1.0) | {"speaker": "Speaker_01"}]
+    json_path.write_text(json.dumps(transcript), encoding="utf-8")
+
+    processor = SpeakerProcessor(ProcessingConfig(pretty_json=pretty_json))
+    processor._update_speakers_in_json(str(json_path), {"Speaker_00": "Professor"})
+
+    expected = [_entry(0.0) | {"speaker": "Professor"}, transcript[1]]
+    indent = 4 if pretty_json else None
+    separators = None if pretty_json else (",", ":")
+    assert json_path.read_text(encoding="utf-8") == json.dumps(
+        expected, indent=indent, separators=separators
+    )
+
+
+@pytest.fixture()
+def warnings():
+    messages = []
+    handler_id = logger.add(messages.append, level="WARNING", format="{message}")
+    yield messages
+    logger.remove(handler_id)
+
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "test",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"titles": {"type": "array", "items": {"type": "string"}}},
+            "required": ["titles"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def test_check_response_accepts_matching_response(warnings):
+    _check_response({"titles": ["Intro"]}, _RESPONSE_FORMAT)
+    assert warnings == []
+
+
+def test_check_response_warns_on_mismatch(warnings):
+    _check_response({"titles": "Intro"}, _RESPONSE_FORMAT)
+    assert any("does not match its schema" in m for m in warnings)
+
+
+def test_factory_schemas_compile(warnings):
+    factory = SchemaFactory()
+    for response_format in (
+        factory.create_ipynb_schema(["A", "B"]),
+        factory.create_no_title_schema(5, True),
+        factory.create_one_title_level_schema(["A", "B"]),
+    ):
+        _check_response({}, response_format)
+    assert not [m for m in warnings if "unsupported schema" in m]
@@ -0,0 +1,26 @@
+"""Tests for the schema builders and utilities in title_handle_helpers."""
+
+from file_conversion_router.utils import title_handle_helpers as helpers
+
+
+def test_key_concepts_schema_is_not_shared_between_calls():
+    schema = helpers.build_key_concepts_schema(["Intro"])
+    schema["items"]["properties"]["extra"] = {"type": "string"}
+    schema["items"]["properties"]["check_in_question"]["required"].append("extra")
+
+    fresh = helpers.build_key_concepts_schema(["Intro"])
+    assert "extra" not in fresh["items"]["properties"]
+    assert "extra" not in fresh["items"]["properties"]["check_in_question"]["required"]
+
+
+def test_problems_schema_is_not_shared_between_calls():
+    schema = helpers.build_problems_schema()
+    schema["items"]["properties"]["sub_problem_1"]["properties"]["options"]["minItems"] = 5
+
+    fresh = helpers.build_problems_schema()
+    assert fresh["items"]["properties"]["sub_problem_1"]["properties"]["options"]["minItems"] == 2
+
+
+def test_prepare_title_list_replaces_double_quotes():
+    index_helper = [{'The "main" idea': 1}, {"Plain": 2, 'Say "hi"': 3}]
+    assert helpers.prepare_title_list(index_helper) == ["The 'main' idea", "Plain", "Say 'hi'"]
@@ -0,0 +1,36 @@
+"""Tests for SSE frame formatting in web.schemas."""
+
+import json
+
+from file_conversion_router.web.schemas import FileStatus, ProgressEvent, ProgressEventType
+
+
+def _parse_frame(frame: bytes):
+    event_line, data_line, *rest = frame.decode("utf-8").split("\n")
+    assert rest == ["", ""]
+    assert event_line.startswith("event: ")
+    assert data_line.startswith("data: ")
+    return event_line[len("event: "):], json.loads(data_line[len("data: "):])
+
+
+def test_to_sse_formats_event_frame():
+    event = ProgressEvent(
+        event_type=ProgressEventType.FILE_DONE,
+        job_id="job-1",
+        timestamp=1.5,
+        file_name="lecture 1 – intro.pdf",
+        file_status=FileStatus.COMPLETED,
+    )
+
+    frame = event.to_sse()
+
+    assert isinstance(frame, bytes)
+    event_type, data = _parse_frame(frame)
+    assert event_type == "file_done"
+    assert data == json.loads(event.model_dump_json())
+    assert data["file_name"] == "lecture 1 – intro.pdf"
+
+
+def test_to_sse_returns_cached_frame():
+    event = ProgressEvent(event_type=ProgressEventType.JOB_START, job_id="job-1", total_files=3)
+    assert event.to_sse() is event.to_sse()
@@ -234,3 +234,26 @@ def test_speaker_json_output(sample_wav, tmp_path):
         assert "end time" in entry, f"Entry missing 'end time': {entry}"
         assert "speaker" in entry, f"Entry missing 'speaker': {entry}"
         assert "text content" in entry, f"Entry missing 'text content': {entry}"
+
+
+# ---------------------------------------------------------------------------
+# Test 7: Cached models are released before other GPU work
+# ---------------------------------------------------------------------------
+
+@pytest.mark.ocr
+def test_release_whisperx_models_frees_vram():
+    """Verify release_whisperx_models drops the cached model and its VRAM."""
+    import torch
+    from file_conversion_router.conversion.video_converter import (
+        _load_whisperx_model,
+        release_whisperx_models,
+    )
+
+    _load_whisperx_model("large-v3", "cuda", "float16", "en")
+    assert _load_whisperx_model.cache_info().currsize == 1
+    reserved = torch.cuda.memory_reserved()
+
+    release_whisperx_models()
+
+    assert _load_whisperx_model.cache_info().currsize == 0
+    assert torch.cuda.memory_reserved() <= reserved